@@ -0,0 +1,105 @@
+"""
+Cold-startup import budget for the `cased` CLI.
+
+Runs `python -X importtime` in a fresh interpreter and fails (exit code 1)
+when the cumulative import time of the CLI entry point exceeds the budget.
+
+Usage:
+    python benchmarks/import_time.py [--module cased_cli.cli] [--budget-ms 150]
+                                     [--runs 5] [--top 10]
+
+The budget can also be set with the CASED_IMPORT_BUDGET_MS environment variable.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+DEFAULT_MODULE = "cased_cli.cli"
+DEFAULT_BUDGET_MS = 150.0
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+
+def measure_import(module: str) -> tuple[float, list[tuple[int, str]]]:
+    """
+    Import `module` in a fresh interpreter and return its cumulative import
+    time in milliseconds along with the (self_us, name) pairs of every import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            **os.environ,
+            "PYTHONDONTWRITEBYTECODE": "1",
+            # Import cased_cli from this checkout, wherever this runs from.
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+            ),
+        },
+    )
+
+    total_us = None
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        imports.append((int(self_us), name))
+        # Top-level imports have a single leading space.
+        if name == module and len(indent) == 1:
+            total_us = int(cumulative_us)
+
+    if total_us is None:
+        raise RuntimeError(f"Could not find '{module}' in -X importtime output")
+    return total_us / 1000, imports
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get("CASED_IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS)),
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm the filesystem and bytecode caches once, then measure.
+    measure_import(args.module)
+    timings = []
+    imports = []
+    for _ in range(args.runs):
+        total_ms, imports = measure_import(args.module)
+        timings.append(total_ms)
+
+    median_ms = statistics.median(timings)
+    print(
+        f"{args.module}: median {median_ms:.1f} ms over {args.runs} runs "
+        f"(min {min(timings):.1f} ms, max {max(timings):.1f} ms), "
+        f"budget {args.budget_ms:.1f} ms"
+    )
+    print("Slowest imports (self time) of the last run:")
+    for self_us, name in sorted(imports, reverse=True)[: args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {name}")
+
+    if median_ms > args.budget_ms:
+        print(f"FAIL: import time regressed past the {args.budget_ms:.1f} ms budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
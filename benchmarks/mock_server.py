@@ -0,0 +1,233 @@
+"""
+Local stand-in for the Cased API, used by the benchmarks.
+
+Serves the endpoints the CLI talks to with a configurable response latency and
+payload size, entirely offline:
+
+    GET  /projects
+    GET  /api/v1/branches        (paginated with limit/cursor)
+    GET  /api/v1/targets
+    GET  /api/v1/deployments     (paginated with limit/cursor)
+    POST /api/v1/branch-deploys
+    GET  .../secrets/<project>/setup
+    POST .../secrets/<project>/setup
+    POST /api/v1/validate-token/
+
+List responses carry an ETag and honour If-None-Match, like the real API.
+
+Usage:
+    python benchmarks/mock_server.py [--port 8765] [--latency-ms 20]
+                                     [--items 100] [--padding 200]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def build_payloads(items: int, padding: int) -> dict:
+    """Response bodies for every list endpoint, `items` entries each."""
+    filler = "x" * padding
+    projects = [
+        {
+            "id": i,
+            "repository_full_name": f"cased/service-{i}",
+            "code_host": "github",
+            "latest_deployment": {"branch": "main"} if i % 2 else None,
+            "description": filler,
+        }
+        for i in range(items)
+    ]
+    branches = [
+        {
+            "branch_name": f"feature-{i}",
+            "owner": "octocat",
+            "number": i,
+            "title": f"Feature {i}",
+            "deployable": i % 3 != 0,
+            "mergeable": True,
+            "approved": i % 2 == 0,
+            "up_to_date": True,
+            "checks_passing": True,
+            "targets": [{"name": "dev"}, {"name": "staging"}],
+            "description": filler,
+        }
+        for i in range(items)
+    ]
+    deployments = [
+        {
+            "id": i,
+            "start_time": f"2024-10-01T{i % 24:02d}:{i % 60:02d}:00Z",
+            "end_time": f"2024-10-01T{i % 24:02d}:{i % 60:02d}:30Z",
+            "deployer": {"first_name": "Mona", "last_name": "Lisa"},
+            "status": "success",
+            "ref": f"refs/heads/feature-{i}",
+            "target": {"name": "dev"},
+            "description": filler,
+        }
+        for i in range(items)
+    ]
+    targets = [{"name": name} for name in ("dev", "staging", "prod")]
+    return {
+        "projects": projects,
+        "pull_requests": branches,
+        "deployments": deployments,
+        "targets": targets,
+    }
+
+
+def secrets_project(path: str) -> str:
+    """The project of a `.../secrets/<project>/setup` path."""
+    parts = path.split("/")
+    return parts[parts.index("secrets") + 1]
+
+
+class MockCasedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Set on the subclass created by MockCasedServer.
+    latency = 0.0
+    payloads: dict = {}
+    secrets: dict = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, etag=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_page(self, key, query):
+        items = self.payloads[key]
+        limit = int(query.get("limit", [len(items) or 1])[0])
+        start = int(query.get("cursor", [0])[0])
+        page = items[start : start + limit]
+        body = {key: page}
+        if start + limit < len(items):
+            body["next_cursor"] = str(start + limit)
+
+        etag = '"%s"' % hashlib.md5(f"{key}:{start}:{limit}".encode()).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send_json(200, body, etag)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/projects":
+            self._send_page("projects", query)
+        elif url.path == "/api/v1/branches":
+            self._send_page("pull_requests", query)
+        elif url.path == "/api/v1/deployments":
+            self._send_page("deployments", query)
+        elif url.path == "/api/v1/targets":
+            self._send_page("targets", query)
+        elif "/secrets/" in url.path:
+            project = secrets_project(url.path)
+            names = sorted(self.secrets.get(project, ()))
+            self._send_json(200, {"keys": [{"name": name} for name in names]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        time.sleep(self.latency)
+        url = urlsplit(self.path)
+        body = self._read_json()
+        if url.path == "/api/v1/branch-deploys":
+            self._send_json(201, {"id": 1, **body})
+        elif "/secrets/" in url.path:
+            project = secrets_project(url.path)
+            names = {key["name"] for key in body.get("keys", [])}
+            self.secrets.setdefault(project, set()).update(names)
+            self._send_json(201, {})
+        elif url.path == "/api/v1/validate-token/":
+            self._send_json(200, {"org_id": 1, "org_name": body.get("org_name")})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+
+class MockCasedServer:
+    """
+    Run the mock API on a background thread:
+
+        with MockCasedServer(latency_ms=20, items=100) as server:
+            env = {"CASED_BASE_URL": server.url}
+    """
+
+    def __init__(self, port=0, latency_ms=0.0, items=50, padding=0):
+        handler = type(
+            "Handler",
+            (MockCasedHandler,),
+            {
+                "latency": latency_ms / 1000,
+                "payloads": build_payloads(items, padding),
+                "secrets": {},
+            },
+        )
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument(
+        "--padding", type=int, default=0, help="Extra bytes of payload per item"
+    )
+    args = parser.parse_args()
+
+    server = MockCasedServer(args.port, args.latency_ms, args.items, args.padding)
+    print(f"Mock Cased API listening on {server.url}", flush=True)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
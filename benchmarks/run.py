@@ -0,0 +1,303 @@
+"""
+Benchmark suite for the `cased` CLI, run offline against a local mock API.
+
+Measures:
+    startup          `cased --help` in a fresh interpreter
+    cmd:*            end-to-end command latency (subprocess, mock API)
+    verify-env:scan  EnvChecker scan of a synthetic repository
+    build:*          workflow render time, and `cased build --force` end to end
+
+Commands run with a throwaway HOME (logged in, project selected) and
+CASED_BASE_URL pointing at benchmarks/mock_server.py, so nothing touches the
+real API or your configuration.
+
+When pyperf is installed the benchmarks run under pyperf.Runner (worker
+processes, calibration, system-noise checks); store results with `-o
+before.json` and compare with `python -m pyperf compare_to before.json
+after.json`. Otherwise a stdlib timer is used: `--save results.json` stores
+the timings and `--compare results.json` prints the change against them.
+
+Usage:
+    python benchmarks/run.py [--bench PATTERN] [--latency-ms 20] [--items 100]
+                             [--padding 200] [--files 20000] [--runs 10]
+                             [--save FILE] [--compare FILE] [--no-pyperf]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+import yaml
+from mock_server import MockCasedServer
+
+try:
+    import pyperf
+except ImportError:
+    pyperf = None
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# The in-process benchmarks import cased_cli from this checkout.
+sys.path.insert(0, str(REPO_ROOT))
+
+ENV_CONFIG = """CASED_API_AUTH_KEY=benchmark-token
+CASED_ORG_ID=1
+CASED_ORG_NAME=benchmark
+CASED_WORKING_PROJECT_NAME=cased/service-1
+CASED_WORKING_PROJECT_ID=1
+"""
+
+DOCKER_CONFIG = {
+    "project": {"name": "benchmark"},
+    "environment": {"language": "python", "python_version": "3.12"},
+    "runtime": {"entry_point": "docker"},
+    "docker": {
+        "enabled": True,
+        "ECR Repository Name": "benchmark",
+        "dockerfile_path": "Dockerfile",
+        "image_name": "benchmark",
+        "ports": ["80:8000"],
+        "environment": ["APP_ENV=production"],
+    },
+    "cloud_deployment": {"region": "us-west-2", "instance_type": "t3.small"},
+}
+
+NON_DOCKER_CONFIG = {
+    "project": {"name": "benchmark"},
+    "environment": {"language": "python", "python_version": "3.12"},
+    "runtime": {
+        "entry_point": "app.py",
+        "commands": {
+            "start": "python app.py",
+            "stop": "pkill -f app.py",
+            "restart": "pkill -f app.py; python app.py",
+        },
+    },
+    "docker": {"enabled": False},
+    "cloud_deployment": {"region": "us-west-2", "instance_type": "t3.small"},
+}
+
+# Name -> CLI arguments. `--no-cache` keeps every run on the network path.
+COMMANDS = {
+    "cmd:projects": ["--no-cache", "--output", "json", "projects"],
+    "cmd:branches": ["--no-cache", "branches", "--limit", "50"],
+    "cmd:deployments": ["--no-cache", "deployments", "--limit", "50"],
+    "cmd:deployments-ndjson": [
+        "--no-cache",
+        "--output",
+        "ndjson",
+        "deployments",
+        "--limit",
+        "50",
+    ],
+    "cmd:targets": ["--no-cache", "targets"],
+    "cmd:deploy": ["deploy", "--branch", "feature-1", "--target", "dev"],
+}
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--bench", action="append", help="Only run benchmarks containing this text"
+    )
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--padding", type=int, default=200)
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--save", help="Write stdlib timings to this JSON file")
+    parser.add_argument("--compare", help="Compare with timings saved by --save")
+    parser.add_argument("--no-pyperf", action="store_true", help="Use the stdlib timer")
+
+
+def make_home(root: Path) -> Path:
+    home = root / "home"
+    config_dir = home / ".cased" / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "env").write_text(ENV_CONFIG)
+    return home
+
+
+def cli_runner(env: dict, args: list, cwd=None):
+    command = [sys.executable, "-m", "cased_cli.cli", *args]
+
+    def run():
+        subprocess.run(
+            command,
+            env=env,
+            cwd=cwd,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    return run
+
+
+def make_build_repo(root: Path) -> Path:
+    repo = root / "build-repo"
+    (repo / ".cased").mkdir(parents=True, exist_ok=True)
+    (repo / ".cased" / "config.yaml").write_text(yaml.safe_dump(DOCKER_CONFIG))
+    if not (repo / ".git").exists():
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        subprocess.run(
+            [
+                "git",
+                "remote",
+                "add",
+                "origin",
+                "https://github.com/cased/benchmark.git",
+            ],
+            cwd=repo,
+            check=True,
+        )
+    return repo
+
+
+def env_tree(files: int) -> Path:
+    """A synthetic repository for verify-env, built once and reused."""
+    from verify_env_scan import build_tree
+
+    root = Path(tempfile.gettempdir()) / f"cased-bench-tree-{files}"
+    if not (root / "manage.py").exists():
+        shutil.rmtree(root, ignore_errors=True)
+        build_tree(root, files)
+    return root
+
+
+def collect_benchmarks(args, stack: ExitStack) -> dict:
+    """Set up fixtures and return {name: zero-argument callable}."""
+    root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="cased-bench-")))
+    home = make_home(root)
+    # In-process benchmarks must not write to the real ~/.cased either.
+    os.environ["HOME"] = str(home)
+
+    server = stack.enter_context(
+        MockCasedServer(
+            latency_ms=args.latency_ms, items=args.items, padding=args.padding
+        )
+    )
+    env = {
+        **os.environ,
+        "HOME": str(home),
+        "CASED_BASE_URL": server.url,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+        ),
+        "COLUMNS": "120",
+    }
+
+    benchmarks = {"startup": cli_runner(env, ["--help"])}
+    for name, command in COMMANDS.items():
+        benchmarks[name] = cli_runner(env, command)
+
+    def verify_env_scan():
+        from cased_cli.commands.verify_env import EnvChecker
+
+        checker = EnvChecker(root=env_tree(args.files), use_index=False)
+        try:
+            checker.scan_files()
+        finally:
+            checker.cleanup()
+
+    benchmarks["verify-env:scan"] = verify_env_scan
+
+    def render(config):
+        def run():
+            from cased_cli.commands.build import generate_workflow
+
+            generate_workflow(config)
+
+        return run
+
+    benchmarks["build:render-docker"] = render(DOCKER_CONFIG)
+    benchmarks["build:render-non-docker"] = render(NON_DOCKER_CONFIG)
+    benchmarks["build:end-to-end"] = cli_runner(
+        env, ["build", "--force"], cwd=make_build_repo(root)
+    )
+
+    if args.bench:
+        benchmarks = {
+            name: func
+            for name, func in benchmarks.items()
+            if any(pattern in name for pattern in args.bench)
+        }
+    return benchmarks
+
+
+def run_stdlib(benchmarks: dict, args) -> dict:
+    results = {}
+    for name, func in benchmarks.items():
+        func()  # warm up caches and imports
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        results[name] = timings
+        stdev = statistics.stdev(timings) if len(timings) > 1 else 0.0
+        print(
+            f"{name:26} median {statistics.median(timings) * 1000:9.2f} ms "
+            f"+- {stdev * 1000:7.2f} ms  (min {min(timings) * 1000:.2f} ms)",
+            flush=True,
+        )
+    return results
+
+
+def compare(results: dict, baseline_path: str) -> None:
+    with open(baseline_path, "r") as file:
+        baseline = json.load(file)["results"]
+    print(f"\nCompared with {baseline_path}:")
+    for name, timings in results.items():
+        if name not in baseline:
+            continue
+        before = statistics.median(baseline[name])
+        after = statistics.median(timings)
+        change = (after - before) / before * 100
+        print(
+            f"{name:26} {before * 1000:9.2f} ms -> {after * 1000:9.2f} ms "
+            f"({change:+.1f}%)"
+        )
+
+
+def main() -> int:
+    if pyperf is not None and "--no-pyperf" not in sys.argv:
+        runner = pyperf.Runner()
+        add_arguments(runner.argparser)
+        args = runner.parse_args()
+    else:
+        runner = None
+        parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+        add_arguments(parser)
+        args = parser.parse_args()
+
+    with ExitStack() as stack:
+        benchmarks = collect_benchmarks(args, stack)
+        if runner is not None:
+            for name, func in benchmarks.items():
+                runner.bench_func(name, func)
+            return 0
+
+        print(
+            f"{len(benchmarks)} benchmarks, {args.runs} runs each, "
+            f"latency {args.latency_ms:g} ms, {args.items} items/list"
+        )
+        results = run_stdlib(benchmarks, args)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"args": vars(args), "results": results}, file, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
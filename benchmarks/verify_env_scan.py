@@ -0,0 +1,130 @@
+"""
+Scan throughput of `cased verify-env` on a synthetic repository.
+
+Builds a tree of roughly `--files` files (including venv/, node_modules/ and
+.git/ noise that must be pruned) and times EnvChecker's single-pass scan, with
+and without a warm env-index, against the previous one-glob-per-pattern
+implementation.
+
+Usage:
+    python benchmarks/verify_env_scan.py [--files 100000] [--runs 3] [--dir PATH]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Import cased_cli from this checkout, without requiring it to be installed.
+sys.path.insert(0, str(REPO_ROOT))
+
+from cased_cli.commands.verify_env import EnvChecker  # noqa: E402
+
+SETTINGS_CONTENT = """import os
+
+DEBUG = os.environ.get("DEBUG", "0") == "1"
+DATABASE_URL = os.environ["DATABASE_URL"]
+SECRET_KEY = os.getenv("SECRET_KEY")
+"""
+
+
+def build_tree(root: Path, total_files: int) -> None:
+    """Create `total_files` files spread over services, packages and noise dirs."""
+    services = max(1, total_files // 1000)
+    per_service = total_files // services
+    for service in range(services):
+        service_dir = root / f"service_{service}"
+        # ~70% application code, ~30% directories the scanner must prune.
+        layout = {
+            "app": int(per_service * 0.6),
+            "venv/lib/site-packages/pkg": int(per_service * 0.15),
+            "node_modules/pkg": int(per_service * 0.1),
+            ".git/objects": int(per_service * 0.05),
+            "tests": int(per_service * 0.1),
+        }
+        for sub_dir, count in layout.items():
+            directory = service_dir / sub_dir
+            for batch in range(0, count, 100):
+                batch_dir = directory / f"m{batch // 100}"
+                batch_dir.mkdir(parents=True, exist_ok=True)
+                for i in range(min(100, count - batch)):
+                    (batch_dir / f"f{i}.py").write_text("x = 1\n")
+        for matched in ("settings/base.py", "config/prod.py", "wsgi.py", "env.py"):
+            path = service_dir / matched
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(SETTINGS_CONTENT)
+    (root / "manage.py").write_text(SETTINGS_CONTENT)
+
+
+def legacy_scan(checker: EnvChecker) -> set:
+    """The previous implementation: one recursive glob per pattern."""
+    exclude_patterns = ["*/.*", "*/venv/*", "*/__pycache__/*", "*/dist/*", "*/.git/*"]
+    found_vars = set()
+    for pattern in checker.PYTHON_PATHS:
+        for file in checker.cwd.glob(pattern.lstrip("/")):
+            if any(file.match(exclude) for exclude in exclude_patterns):
+                continue
+            found_vars.update(checker.scan_file(file))
+    return found_vars
+
+
+def timed(func, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--dir", help="Reuse (or create) the synthetic tree here instead of a temp dir"
+    )
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    root = Path(args.dir) if args.dir else Path(tempfile.mkdtemp(prefix="cased-env-"))
+    try:
+        if not (root / "manage.py").exists():
+            print(f"Building a {args.files}-file tree in {root}...")
+            build_tree(root, args.files)
+
+        checker = EnvChecker(root=root, use_index=False)
+        indexed_checker = EnvChecker(root=root)
+        try:
+            file_count = sum(len(files) for _, _, files in os.walk(root))
+            results = {"single-pass": timed(checker.scan_files, args.runs)}
+            # Populate the index once, then measure warm runs.
+            indexed_checker.scan_files()
+            results["warm index"] = timed(indexed_checker.scan_files, args.runs)
+            if not args.skip_legacy:
+                results["legacy glob"] = timed(lambda: legacy_scan(checker), args.runs)
+        finally:
+            checker.cleanup()
+            indexed_checker.cleanup()
+            shutil.rmtree(root / ".cased", ignore_errors=True)
+
+        print(f"{file_count} files, {args.runs} runs")
+        for name, timings in results.items():
+            median = statistics.median(timings)
+            print(
+                f"  {name:12} median {median * 1000:8.1f} ms  "
+                f"({file_count / median:,.0f} files/s)"
+            )
+    finally:
+        if not args.dir:
+            shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
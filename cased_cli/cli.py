@@ -1,35 +1,162 @@
+import importlib
+
 import click
-from cased_cli.commands.build import build
-from cased_cli.commands.deploy import deploy
-from cased_cli.commands.init import init
-from cased_cli.commands.login import login, logout
-from cased_cli.commands.resources import branches, deployments, projects, targets
-from cased_cli.commands.verify_env import verify_env
+from cased_cli.utils.output import OUTPUT_FORMATS, configure_output
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
+# Command name -> (import path, one-line help shown by `cased --help`).
+# Command modules pull in heavy dependencies (questionary, inquirer, jinja2,
+# requests, rich...), so they are only imported when the command is invoked.
+LAZY_COMMANDS = {
+    "branches": (
+        "cased_cli.commands.resources.branches",
+        "Display active branches.",
+    ),
+    "build": (
+        "cased_cli.commands.build.build",
+        "Generate the GitHub Actions deploy workflow.",
+    ),
+    "deploy": (
+        "cased_cli.commands.deploy.deploy",
+        "Deploy a branch to a target environment.",
+    ),
+    "deployments": (
+        "cased_cli.commands.resources.deployments",
+        "Display recent deployments.",
+    ),
+    "init": (
+        "cased_cli.commands.init.init",
+        "Initialize a new project configuration (alpha)",
+    ),
+    "login": ("cased_cli.commands.login.login", "Log in to the Cased system."),
+    "logout": (
+        "cased_cli.commands.login.logout",
+        "Log out from your Cased account.",
+    ),
+    "projects": (
+        "cased_cli.commands.resources.projects",
+        "Display and select Cased projects.",
+    ),
+    "targets": (
+        "cased_cli.commands.resources.targets",
+        "Display target environments.",
+    ),
+    "validate": (
+        "cased_cli.commands.validate.validate",
+        "Validate .cased/config.yaml without generating anything.",
+    ),
+    "verify-env": (
+        "cased_cli.commands.verify_env.verify_env",
+        "Check for missing required environment variables.",
+    ),
+    "watch": (
+        "cased_cli.commands.watch.watch",
+        "Watch deployments until they finish.",
+    ),
+}
+
 
-@click.group()
-def cli():
+class LazyGroup(click.Group):
+    """
+    A click group that registers commands by import path and only imports the
+    command module when the command is actually resolved.
+    """
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        # Use the registered short help so `cased --help` does not import
+        # every command module just to print one line per command.
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.commands:
+                cmd = self.commands[cmd_name]
+                if cmd.hidden:
+                    continue
+                help_text = cmd.get_short_help_str(formatter.width - 6 - len(cmd_name))
+            else:
+                help_text = self.lazy_commands[cmd_name][1]
+            rows.append((cmd_name, help_text))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name):
+        import_path = self.lazy_commands[cmd_name][0]
+        module_name, attr_name = import_path.rsplit(".", 1)
+        command = getattr(importlib.import_module(module_name), attr_name)
+        if not isinstance(command, click.BaseCommand):
+            raise ValueError(f"Lazy command '{import_path}' is not a click command")
+        return command
+
+
+@click.group(
+    cls=LazyGroup, lazy_commands=LAZY_COMMANDS, context_settings=CONTEXT_SETTINGS
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Do not read or write the local API response cache.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Revalidate cached API responses with the server before using them.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="table",
+    show_default=True,
+    envvar="CASED_OUTPUT",
+    help="Output format of list commands. ndjson streams one JSON object per line.",
+)
+@click.option(
+    "--trace",
+    is_flag=True,
+    default=False,
+    envvar="CASED_TRACE",
+    help="Print per-request timings and command phase spans to stderr.",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False, writable=True),
+    envvar="CASED_TRACE_FILE",
+    help="Write a Chrome trace-event JSON file (chrome://tracing, Perfetto).",
+)
+@click.pass_context
+def cli(ctx, no_cache, refresh, output, trace, trace_file):
     """
     Cased CLI for authentication, target setup, and branch deployment.
 
     Use 'cased COMMAND --help' for more information on a specific command.
     """
+    from cased_cli.utils.cache import cache_enabled, configure_cache
+
+    configure_cache(enabled=cache_enabled() and not no_cache, refresh=refresh)
+    configure_output(output)
 
-    pass
+    if trace or trace_file:
+        from cased_cli.utils.tracing import start_tracing
 
+        tracer = start_tracing(ctx.invoked_subcommand, trace_file, summary=trace)
+        ctx.call_on_close(tracer.finish)
 
-cli.add_command(deploy)
-cli.add_command(init)
-cli.add_command(build)
-cli.add_command(login)
-cli.add_command(logout)
-cli.add_command(deployments)
-cli.add_command(branches)
-cli.add_command(projects)
-cli.add_command(targets)
-cli.add_command(verify_env)
 
 main = cli
 
@@ -1,17 +1,32 @@
+import hashlib
+import json
 import os
+import re
+import shlex
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
 import yaml
+from cased_cli import __version__
 from cased_cli.utils.api import CasedAPI
 from cased_cli.utils.constants import CasedConstants
+from cased_cli.utils.exception import CasedConfigError
 from cased_cli.utils.git import get_repo_name
-from jinja2 import Environment, FileSystemLoader
+from cased_cli.utils.project_config import (
+    CONFIG_PATH,
+    discover_configs,
+    load_project_config,
+    validate_project_config,
+)
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, meta, nodes
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 console = Console()
 # Get the directory of the current script
@@ -20,17 +35,140 @@ CURRENT_DIR = Path(__file__).resolve().parent
 CASED_DIR = CURRENT_DIR.parent
 # Set the path to the templates directory
 TEMPLATES_DIR = CASED_DIR / "templates"
-CONFIG_PATH = ".cased/config.yaml"
+WORKFLOWS_DIR = ".github/workflows"
+WORKFLOW_PATH = os.path.join(WORKFLOWS_DIR, "deploy.yaml")
+# Compiled templates are cached on disk so new processes skip recompiling them.
+JINJA_CACHE_DIR = os.path.join(CasedConstants.CACHE_DIR, "jinja")
+MANIFEST_PATH = ".cased/build-manifest.json"
+# Matches GitHub Actions secret references such as `${{ secrets.AWS_REGION }}`.
+SECRET_REFERENCE = re.compile(r"\bsecrets\.([A-Za-z_][A-Za-z0-9_]*)")
+# Lockfiles and manifests that key the dependency cache, most specific first.
+DEPENDENCY_FILES = (
+    "poetry.lock",
+    "Pipfile.lock",
+    "requirements.txt",
+    "pyproject.toml",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "package.json",
+)
+
+
+class BuildManifest:
+    """
+    Record of what the last `cased build` produced, used to skip rendering,
+    file writes and the secrets API call when nothing changed.
+
+    Each workflow is keyed by its path and stores the hash of its inputs (config
+    contents, template sources and CLI version), the hash of the file written
+    and the secrets it references. Secrets already set up are tracked per
+    project.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str = MANIFEST_PATH):
+        self.path = path
+        self.workflows = {}
+        self.secrets = {}
+        self.dirty = False
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION:
+            self.workflows = data.get("workflows", {})
+            self.secrets = data.get("secrets", {})
+
+    @staticmethod
+    def _hash_secrets(secrets: List[str]) -> str:
+        return hashlib.sha256("\n".join(sorted(secrets)).encode()).hexdigest()
+
+    def is_current(self, workflow_path: str, inputs_hash: str) -> bool:
+        """True if `workflow_path` was built from these inputs and is untouched."""
+        entry = self.workflows.get(workflow_path)
+        if not entry or entry["inputs"] != inputs_hash:
+            return False
+        try:
+            with open(workflow_path, "rb") as file:
+                return hashlib.sha256(file.read()).hexdigest() == entry["output"]
+        except OSError:
+            return False
+
+    def workflow_secrets(self, workflow_path: str) -> List[str]:
+        return self.workflows.get(workflow_path, {}).get("secrets", [])
+
+    def record_workflow(
+        self, workflow_path: str, inputs_hash: str, content: str, secrets: List[str]
+    ) -> None:
+        self.workflows[workflow_path] = {
+            "inputs": inputs_hash,
+            "output": hashlib.sha256(content.encode()).hexdigest(),
+            "secrets": secrets,
+        }
+        self.dirty = True
+
+    def secrets_synced(self, project_name: str, secrets: List[str]) -> bool:
+        return self.secrets.get(project_name) == self._hash_secrets(secrets)
+
+    def record_secrets(self, project_name: str, secrets: List[str]) -> None:
+        self.secrets[project_name] = self._hash_secrets(secrets)
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "workflows": self.workflows,
+                    "secrets": self.secrets,
+                },
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.path)
+        self.dirty = False
 
 
 @click.command()
-def build() -> None:
+@click.option(
+    "--all",
+    "build_all",
+    is_flag=True,
+    default=False,
+    help="Build a workflow for every .cased/config.yaml found in the repository.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Regenerate workflows and set up secrets even if nothing changed.",
+)
+def build(build_all: bool = False, force: bool = False) -> None:
     """
     Generate a GitHub Actions workflow based on the configuration in .cased/config.yaml.
 
     This command reads the configuration file, validates it, generates a workflow file
     in the .github/workflows directory, and sets up necessary secrets.
-    """
+
+    Use the --all option in a monorepo to discover every .cased/config.yaml, then
+    validate and render them in parallel. Each service gets its own workflow file
+    and only workflows whose content changed are rewritten.
+
+    Builds are skipped when the configuration, templates and CLI version are
+    unchanged since the last build; use --force to rebuild anyway.
+    """  # noqa: E501
+    if build_all:
+        build_all_services(force=force)
+        return
+
     if not os.path.exists(CONFIG_PATH):
         console.print(
             "[red]Error: Configuration file not found at .cased/config.yaml[/red]"
@@ -40,41 +178,75 @@ def build() -> None:
         )
         sys.exit(1)
 
-    config = load_config(CONFIG_PATH)
+    manifest = BuildManifest()
+    inputs_hash = compute_inputs_hash(CONFIG_PATH)
+    up_to_date = not force and manifest.is_current(WORKFLOW_PATH, inputs_hash)
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        validate_task = progress.add_task(
-            "[cyan]Validating configuration...", total=100
-        )
-        try:
-            validate_config(config)
+    if up_to_date:
+        secrets = manifest.workflow_secrets(WORKFLOW_PATH)
+    else:
+        config = load_config(CONFIG_PATH)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            validate_task = progress.add_task(
+                "[cyan]Validating configuration...", total=100
+            )
+            try:
+                validate_config(config)
+                progress.update(
+                    validate_task,
+                    completed=100,
+                    description="[bold green]Configuration validated successfully!",
+                )
+            except ValueError as e:
+                progress.update(validate_task, completed=100)
+                console.print(f"[red]Configuration validation failed: {str(e)}[/red]")
+                sys.exit(1)
+
+            generate_task = progress.add_task("[cyan]Generating workflow...", total=100)
+            workflow_content = generate_workflow(config)
+            save_workflow(workflow_content)
             progress.update(
-                validate_task,
+                generate_task,
                 completed=100,
-                description="[bold green]Configuration validated successfully!",
+                description="[bold green]Workflow generated successfully!",
             )
-        except ValueError as e:
-            progress.update(validate_task, completed=100)
-            console.print(f"[red]Configuration validation failed: {str(e)}[/red]")
-            sys.exit(1)
-
-        generate_task = progress.add_task("[cyan]Generating workflow...", total=100)
-        workflow_content = generate_workflow(config)
-        save_workflow(workflow_content)
-        progress.update(
-            generate_task,
-            completed=100,
-            description="[bold green]Workflow generated successfully!",
-        )
+
+        secrets = extract_secrets_from_workflow(workflow_content)
+        manifest.record_workflow(WORKFLOW_PATH, inputs_hash, workflow_content, secrets)
 
     project_name = get_repo_name()
-    secrets = extract_secrets_from_workflow(workflow_content)
-    CasedAPI().create_secrets(project_name, secrets)
+    secrets_synced = sync_secrets(manifest, project_name, secrets, force=force)
+    manifest.save()
+
+    if up_to_date and secrets_synced:
+        console.print(
+            "[green]Workflow is up to date, nothing to build. Use --force to rebuild.[/green]"  # noqa: E501
+        )
+        return
+
+    display_success(project_name)
+
+
+def sync_secrets(
+    manifest: BuildManifest, project_name: str, secrets: List[str], force: bool = False
+) -> bool:
+    """
+    Set up `secrets` unless the manifest shows they already were. Returns True
+    if the secrets were already in sync and no API call was made.
+    """
+    if not force and manifest.secrets_synced(project_name, secrets):
+        return True
+    if CasedAPI().create_secrets(project_name, secrets):
+        manifest.record_secrets(project_name, secrets)
+    return False
+
 
+def display_success(project_name: str) -> None:
     console.print(
         Panel(
             f"""
@@ -92,85 +264,266 @@ def build() -> None:
 
 
 def load_config(file_path: str) -> Dict[str, Any]:
-    with open(file_path, "r") as file:
-        return yaml.safe_load(file)
+    return load_project_config(file_path)
+
+
+@lru_cache(maxsize=1)
+def _templates_digest() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(TEMPLATES_DIR.iterdir()):
+        if path.is_file():
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def service_root(config_path: str) -> str:
+    """The directory of the service a .cased/config.yaml belongs to."""
+    return os.path.dirname(os.path.dirname(config_path)) or "."
 
 
-def generate_workflow(config: Dict[str, Any]) -> str:
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+def find_dependency_files(
+    config: Optional[Dict[str, Any]] = None, root: str = "."
+) -> List[str]:
+    """
+    Return the dependency files the workflow's cache key is built from, as
+    paths relative to the repository root.
+
+    Files declared in `environment.dependency_files` are used when they exist;
+    otherwise the well-known lockfiles and manifests in `root` are detected.
+    """
+    declared = []
+    if config:
+        declared = (config.get("environment") or {}).get("dependency_files") or []
+    for names in (declared, DEPENDENCY_FILES):
+        found = [
+            os.path.normpath(os.path.join(root, name))
+            for name in names
+            if isinstance(name, str) and os.path.isfile(os.path.join(root, name))
+        ]
+        if found:
+            return found
+    return []
+
 
+def compute_inputs_hash(config_path: str) -> str:
+    """Hash everything a workflow is rendered from."""
+    digest = hashlib.sha256()
+    digest.update(__version__.encode())
+    digest.update(_templates_digest().encode())
+    with open(config_path, "rb") as file:
+        digest.update(file.read())
+    # Which dependency files exist decides the cache steps; their contents
+    # only matter at workflow run time.
+    root = service_root(config_path)
+    digest.update(
+        "\n".join(
+            name
+            for name in DEPENDENCY_FILES
+            if os.path.isfile(os.path.join(root, name))
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_template_environment() -> Environment:
+    """
+    Return the shared jinja2 environment.
+
+    The environment keeps compiled templates in memory for the life of the
+    process, and its bytecode cache lets later processes skip compilation.
+    """
+    bytecode_cache = None
+    try:
+        os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+    except OSError:
+        pass
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR), bytecode_cache=bytecode_cache
+    )
+    env.filters["dirname"] = os.path.dirname
+    env.filters["relpath"] = os.path.relpath
+    env.filters["shell_quote"] = shlex.quote
+    return env
+
+
+def template_name_for(config: Dict[str, Any]) -> str:
     if config["docker"]["enabled"]:
-        template = env.get_template("docker_ec2_template.yaml")
-    else:
-        template = env.get_template("non_docker_ec2_template.yaml")
+        return "docker_ec2_template.yaml"
+    return "non_docker_ec2_template.yaml"
+
+
+def generate_workflow(
+    config: Dict[str, Any], root: str = ".", workflow_path: str = WORKFLOW_PATH
+) -> str:
+    """
+    Render the workflow for the service in `root`. Workflows of nested
+    services only trigger on changes to their directory or workflow file,
+    and run their steps in that directory.
+    """
+    template = get_template_environment().get_template(template_name_for(config))
+    return template.render(
+        config=config,
+        service_dir=os.path.normpath(root),
+        workflow_path=workflow_path,
+        dependency_files=find_dependency_files(config, root),
+    )
 
-    return template.render(config=config)
 
+def save_workflow(content: str, path: str = WORKFLOW_PATH) -> bool:
+    """Write the workflow to `path` unless it already has this content."""
+    try:
+        with open(path, "r") as file:
+            if file.read() == content:
+                return False
+    except OSError:
+        pass
 
-def save_workflow(content: str) -> None:
-    os.makedirs(".github/workflows", exist_ok=True)
-    with open(".github/workflows/deploy.yaml", "w") as file:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
         file.write(content)
+    return True
+
+
+def workflow_path_for(config_path: str) -> str:
+    """
+    Map a service config to its workflow file. The root service keeps
+    deploy.yaml; nested services get deploy-<service-path>.yaml, since GitHub
+    only reads workflows from the repository root.
+    """
+    service_dir = service_root(config_path)
+    if service_dir == ".":
+        return WORKFLOW_PATH
+    slug = service_dir.replace(os.sep, "-").replace("/", "-")
+    return os.path.join(WORKFLOWS_DIR, f"deploy-{slug}.yaml")
+
+
+def build_service(
+    config_path: str, manifest: BuildManifest, force: bool = False
+) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """
+    Load, validate and render one service config, unless the manifest shows
+    its workflow is already up to date.
+
+    Returns (config_path, inputs_hash, workflow_content, error). Both of the
+    last two are None when the build was skipped.
+    """
+    workflow_path = workflow_path_for(config_path)
+    try:
+        inputs_hash = compute_inputs_hash(config_path)
+        if not force and manifest.is_current(workflow_path, inputs_hash):
+            return config_path, inputs_hash, None, None
+        config = load_config(config_path)
+        validate_config(config)
+        workflow_content = generate_workflow(
+            config, service_root(config_path), workflow_path
+        )
+        return config_path, inputs_hash, workflow_content, None
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return config_path, "", None, str(e)
+
+
+def build_all_services(force: bool = False) -> None:
+    config_paths = discover_configs()
+    if not config_paths:
+        console.print("[red]Error: No .cased/config.yaml files found.[/red]")
+        console.print(
+            "Please run 'cased init' to generate the configuration file first."
+        )
+        sys.exit(1)
+
+    manifest = BuildManifest()
+    with console.status(f"Building {len(config_paths)} workflows..."):
+        with ThreadPoolExecutor() as executor:
+            results = list(
+                executor.map(
+                    lambda path: build_service(path, manifest, force), config_paths
+                )
+            )
+
+    table = Table(title="Workflows")
+    table.add_column("Config", style="cyan")
+    table.add_column("Workflow", style="magenta")
+    table.add_column("Status")
+
+    secrets = {}
+    failed = False
+    for config_path, inputs_hash, workflow_content, error in results:
+        workflow_path = workflow_path_for(config_path)
+        if error is not None:
+            failed = True
+            table.add_row(config_path, workflow_path, f"[red]invalid: {error}[/red]")
+            continue
+        if workflow_content is None:
+            workflow_secrets = manifest.workflow_secrets(workflow_path)
+            status = "[dim]up to date[/dim]"
+        else:
+            workflow_secrets = extract_secrets_from_workflow(workflow_content)
+            written = save_workflow(workflow_content, workflow_path)
+            manifest.record_workflow(
+                workflow_path, inputs_hash, workflow_content, workflow_secrets
+            )
+            status = "[green]written[/green]" if written else "[dim]unchanged[/dim]"
+        table.add_row(config_path, workflow_path, status)
+        secrets.update(dict.fromkeys(workflow_secrets))
+
+    console.print(table)
+    if failed:
+        manifest.save()
+        console.print("[red]Configuration validation failed for some services.[/red]")
+        sys.exit(1)
+
+    project_name = get_repo_name()
+    secrets_synced = sync_secrets(manifest, project_name, list(secrets), force=force)
+    manifest.save()
+    if not secrets_synced or any(content for _, _, content, _ in results):
+        display_success(project_name)
 
 
 def extract_secrets_from_workflow(workflow_content: str) -> List[str]:
-    secrets = []
-    for line in workflow_content.split("\n"):
-        if "secrets." in line:
-            secret = line.split("secrets.")[1].split("}")[0].strip()
-            if secret not in secrets:
-                secrets.append(secret)
-    return secrets
+    """Return the secrets referenced in a rendered workflow, in order of appearance."""
+    return list(dict.fromkeys(SECRET_REFERENCE.findall(workflow_content)))
 
 
-def validate_config(config: Dict[str, Any]) -> None:
-    # Project validation
-    if "project" not in config:
-        raise ValueError("Missing 'project' section in config")
-    if "name" not in config["project"]:
-        raise ValueError("Missing 'name' in 'project' section")
-
-    # Environment validation
-    if "environment" not in config:
-        raise ValueError("Missing 'environment' section in config")
-    required_env_fields = ["language", "python_version"]
-    for field in required_env_fields:
-        if field not in config["environment"]:
-            raise ValueError(f"Missing '{field}' in 'environment' section")
-
-    # Docker validation
-    if "docker" not in config:
-        raise ValueError("Missing 'docker' section in config")
-    if "enabled" not in config["docker"]:
-        raise ValueError("Missing 'enabled' field in 'docker' section")
+@lru_cache(maxsize=None)
+def extract_secrets_from_template(template_name: str) -> Tuple[str, ...]:
+    """
+    Statically find the secrets a template can reference, without rendering it.
 
-    if config["docker"]["enabled"]:
-        required_docker_fields = [
-            "ECR Repository Name",
-            "dockerfile_path",
-            "image_name",
-        ]
-        for field in required_docker_fields:
-            if field not in config["docker"]:
-                raise ValueError(f"Missing '{field}' in 'docker' section")
+    Secret references live in the template's literal text (`{% raw %}` blocks
+    and plain text) and string constants, so they are collected from the
+    template AST, following `{% include %}`/`{% extends %}`. Secrets used only
+    in conditional sections are included too, so this is a superset of what
+    any single render references.
+    """
+    env = get_template_environment()
+    secrets = {}
+    pending = [template_name]
+    seen = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        source, _, _ = env.loader.get_source(env, name)
+        ast = env.parse(source)
+        for node in ast.find_all((nodes.TemplateData, nodes.Const)):
+            if isinstance(node, nodes.TemplateData):
+                text = node.data
+            elif isinstance(node.value, str):
+                text = node.value
+            else:
+                continue
+            secrets.update(dict.fromkeys(SECRET_REFERENCE.findall(text)))
+        pending.extend(
+            ref for ref in meta.find_referenced_templates(ast) if ref is not None
+        )
+    return tuple(secrets)
 
-        if not isinstance(config["docker"].get("ports", []), list):
-            raise ValueError("'ports' in 'docker' section must be a list")
 
-        if "environment" in config["docker"] and not isinstance(
-            config["docker"]["environment"], list
-        ):
-            raise ValueError("'environment' in 'docker' section must be a list")
-    else:
-        # Non-docker validation
-        if "runtime" not in config:
-            raise ValueError("Missing 'runtime' section in config for non-docker setup")
-        required_runtime_fields = ["commands", "entry_point"]
-        for field in required_runtime_fields:
-            if field not in config["runtime"]:
-                raise ValueError(f"Missing '{field}' in 'runtime' section")
-
-        required_commands = ["start", "stop", "restart"]
-        for command in required_commands:
-            if command not in config["runtime"]["commands"]:
-                raise ValueError(f"Missing '{command}' in 'runtime.commands' section")
+def validate_config(config: Dict[str, Any]) -> None:
+    errors = validate_project_config(config)
+    if errors:
+        raise CasedConfigError(errors)
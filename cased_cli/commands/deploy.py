@@ -1,49 +1,176 @@
 import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
 
 import click
 import questionary
-from cased_cli.utils.api import CasedAPI
+import yaml
+from cased_cli.commands.watch import wait_for_deployments
+from cased_cli.utils.api import CasedAPI, call_with_retries, is_unprocessed_error
 from cased_cli.utils.auth import validate_credentials
 from cased_cli.utils.constants import CasedConstants
-from cased_cli.utils.progress import run_process_with_status_bar
+from cased_cli.utils.output import (
+    configure_output,
+    emit_rows,
+    machine_output,
+    output_format,
+)
+from cased_cli.utils.progress import (
+    get_executor,
+    run_process_with_status_bar,
+    run_tasks,
+)
 from rich.console import Console
 
+try:
+    # Private questionary API, only used to refresh an open picker in place.
+    from questionary.prompts.common import InquirerControl
+except ImportError:  # pragma: no cover - depends on the questionary version
+    InquirerControl = None
+
 console = Console()
+# Returned by a branch picker closed so it can be reopened with fresh choices.
+_REOPEN_PICKER = object()
 
 
-def _build_questionary_choices(project):
-    api_client = CasedAPI()
-    data = run_process_with_status_bar(
-        api_client.get_branches,
-        f"Fetching branches for project {project}...",
-        timeout=10,
-        project_name=project,
-    )
-    branches = data.get("pull_requests", [])
-    deployable_branches = [
-        branch for branch in branches if branch["deployable"] is True
+class DeployPrefetch:
+    """
+    Start fetching a project's branches in the background as soon as an
+    interactive deploy begins, so the branch picker rarely waits on the
+    network.
+    """
+
+    def __init__(self, project, api=None):
+        self.project = project
+        self.api = api or CasedAPI()
+        # Revalidate: a cached branch list is shown first and then refreshed.
+        self.branches = get_executor().submit(
+            self.api.get_branches, project, revalidate=True
+        )
+
+    def cached_branches(self):
+        return self.api.get_cached_branches(self.project)
+
+    def fresh_branches(self):
+        """The fetched branch list if it already arrived, else None."""
+        if self.branches.done() and not self.branches.exception():
+            return self.branches.result()
+        return None
+
+    def wait_for_branches(self):
+        return run_process_with_status_bar(
+            self.branches.result,
+            f"Fetching branches for project {self.project}...",
+            timeout=10,
+        )
+
+
+def _deployable_branches(data):
+    return [
+        branch
+        for branch in data.get("pull_requests", [])
+        if branch["deployable"] is True
     ]
-    # Prepare choices for questionary
-    choices = [
-        f"{b['branch_name']} -> [{', '.join([target.get('name') for target in b.get('targets', [])])}]"  # noqa: E501
-        for b in deployable_branches
+
+
+def _branch_choices(branches):
+    return [
+        questionary.Choice(
+            title=f"{b['branch_name']} -> [{', '.join([target.get('name') for target in b.get('targets', [])])}]",  # noqa: E501
+            value=b["branch_name"],
+        )
+        for b in branches
     ]
 
+
+def _find_inquirer_control(application):
+    if InquirerControl is None:
+        return None
+    for window in application.layout.find_all_windows():
+        if isinstance(window.content, InquirerControl):
+            return window.content
+    return None
+
+
+def _refresh_choices_when_fetched(question, prefetch):
+    """
+    Replace the choices of an open branch picker once fresh branches arrive,
+    keeping the pointer on the same branch. If questionary's internals cannot
+    be used for that, the picker is closed with _REOPEN_PICKER instead so the
+    caller can prompt again with the fresh choices.
+    """
+    application = question.application
+
+    def update(data):
+        if application.future is None or application.future.done():
+            return
+        choices = _branch_choices(_deployable_branches(data))
+        if not choices:
+            return
+        try:
+            control = _find_inquirer_control(application)
+            if control.is_answered:
+                return
+            current = control.get_pointed_at().value
+            values = [choice.value for choice in choices]
+            control._init_choices(
+                choices, values.index(current) if current in values else None
+            )
+            application.invalidate()
+        except Exception:
+            application.exit(result=_REOPEN_PICKER)
+
+    def on_fetched(future):
+        if future.cancelled() or future.exception():
+            return
+        data = future.result()
+        if application.is_running:
+            application.loop.call_soon_threadsafe(update, data)
+        else:
+            application.pre_run_callables.append(lambda: update(data))
+
+    prefetch.branches.add_done_callback(on_fetched)
+
+
+def _build_questionary_choices(project):
+    prefetch = DeployPrefetch(project)
+    data = prefetch.fresh_branches()
+    opened_from_cache = False
+    if data is None:
+        data = prefetch.cached_branches()
+        opened_from_cache = data is not None
+    if data is None:
+        data = prefetch.wait_for_branches()
+
+    choices = _branch_choices(_deployable_branches(data))
+    if not choices and opened_from_cache:
+        # The cached list may be outdated; only give up on the fresh one.
+        opened_from_cache = False
+        data = prefetch.wait_for_branches()
+        choices = _branch_choices(_deployable_branches(data))
+
     if not choices:
         console.print(
             f"[red]No deployable branches for project {project}. Please see more details at {CasedConstants.BASE_URL}/projects/{project} [/red]"  # noqa: E501
         )
         sys.exit(1)
 
-    selected = questionary.select("Select a branch to deploy:", choices=choices).ask()
+    question = questionary.select("Select a branch to deploy:", choices=choices)
+    if opened_from_cache:
+        _refresh_choices_when_fetched(question, prefetch)
+    branch = question.ask()
+    if branch is _REOPEN_PICKER:
+        data = prefetch.branches.result()
+        choices = _branch_choices(_deployable_branches(data))
+        branch = questionary.select("Select a branch to deploy:", choices=choices).ask()
 
-    if not selected:
+    if not branch:
         console.print("[red]Error: No branch selected.[/red]")
         sys.exit(1)
 
-    branch = selected.split(" -> ")[0]
-
-    # Find the selected branch in our data
+    # Find the selected branch in the freshest data we have
+    deployable_branches = _deployable_branches(prefetch.fresh_branches() or data)
     selected_branch = next(
         (b for b in deployable_branches if b["branch_name"] == branch), None
     )
@@ -62,12 +189,191 @@ def _build_questionary_choices(project):
     return branch, target
 
 
+def load_batch_file(path):
+    """
+    Read (branch, target) pairs from a batch file, either a list of
+    {branch, target} mappings or a mapping with a `deploys` list.
+    """
+    with open(path, "r") as file:
+        data = yaml.safe_load(file) or []
+    if isinstance(data, dict):
+        data = data.get("deploys", [])
+    if not isinstance(data, list):
+        raise click.BadParameter("must contain a list of deploys", param_hint="--batch")
+
+    pairs = []
+    for item in data:
+        if (
+            not isinstance(item, dict)
+            or not item.get("branch")
+            or not item.get("target")
+        ):
+            raise click.BadParameter(
+                f"each deploy needs a branch and a target, got {item!r}",
+                param_hint="--batch",
+            )
+        pairs.append((str(item["branch"]), str(item["target"])))
+    return pairs
+
+
+def pair_branches_and_targets(branches, targets):
+    """Pair repeated --branch/--target options; a single value is used for all."""
+    if not branches or not targets:
+        raise click.UsageError("--branch and --target must be used together.")
+    if len(branches) == len(targets):
+        return list(zip(branches, targets, strict=True))
+    if len(targets) == 1:
+        return [(branch, targets[0]) for branch in branches]
+    if len(branches) == 1:
+        return [(branches[0], target) for target in targets]
+    raise click.UsageError(
+        "--branch and --target must be given the same number of times, "
+        "or one of them exactly once."
+    )
+
+
+def dispatch_deploy(api, project, branch, target, retries):
+    """
+    Dispatch one deploy and report the outcome. Failures are only retried when
+    the request never reached the server, so a deploy is never dispatched
+    twice.
+    """
+    attempts = 0
+
+    def _dispatch():
+        nonlocal attempts
+        attempts += 1
+        # Retried here, counting attempts, rather than inside deploy_branch.
+        return api.deploy_branch(project, branch, target, retries=0)
+
+    start_time = time.monotonic()
+    try:
+        call_with_retries(_dispatch, retries=retries, retry_if=is_unprocessed_error)
+        error = None
+    except Exception as e:
+        error = (str(e).splitlines() or [repr(e)])[0]
+    return {
+        "branch": branch,
+        "target": target,
+        "status": "failed" if error else "dispatched",
+        "attempts": attempts,
+        "latency_ms": round((time.monotonic() - start_time) * 1000),
+        "error": error,
+    }
+
+
+def deploy_batch(
+    project, pairs, concurrency, retries, as_json, wait=False, wait_timeout=None
+):
+    api = CasedAPI()
+    dispatched_at = datetime.now(timezone.utc)
+    results = run_tasks(
+        [
+            (
+                f"Deploying {branch} to {target}",
+                partial(dispatch_deploy, api, project, branch, target, retries),
+            )
+            for branch, target in pairs
+        ],
+        max_concurrency=concurrency,
+    )
+
+    if as_json or machine_output():
+        emit_rows(results, "json" if as_json else output_format())
+    else:
+        from rich.table import Table
+
+        table = Table(title=f"Deployments for {project}")
+        table.add_column("Branch", style="cyan")
+        table.add_column("Target", style="yellow")
+        table.add_column("Status")
+        table.add_column("Attempts", justify="right")
+        table.add_column("Latency", justify="right")
+        for result in results:
+            status = (
+                f"[red]failed: {result['error']}[/red]"
+                if result["error"]
+                else "[green]dispatched[/green]"
+            )
+            table.add_row(
+                result["branch"],
+                result["target"],
+                status,
+                str(result["attempts"]),
+                f"{result['latency_ms']} ms",
+            )
+        console.print(table)
+
+    if any(result["error"] for result in results):
+        sys.exit(1)
+
+    if wait:
+        wait_for_deployments(project, pairs, dispatched_at, timeout=wait_timeout)
+
+
 @click.command()
 @click.option("--project", help="Project name to deploy")
-@click.option("--branch", help="Branch to deploy")
-@click.option("--target", help="Target environment for deployment")
+@click.option(
+    "--branch",
+    "branches",
+    multiple=True,
+    help="Branch to deploy. Repeat to deploy several branches.",
+)
+@click.option(
+    "--target",
+    "targets",
+    multiple=True,
+    help="Target environment for deployment. Repeat to pair with each --branch.",
+)
+@click.option(
+    "--batch",
+    "batch_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML file listing the branch/target pairs to deploy.",
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1, max=CasedConstants.API_MAX_CONCURRENCY),
+    help="Maximum number of deployments dispatched at once in batch mode.",
+)
+@click.option(
+    "--retries",
+    default=2,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Retries per deployment that never reached the server, in batch mode.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="Print the batch summary as JSON (same as `cased --output json`).",
+)
+@click.option(
+    "--wait",
+    is_flag=True,
+    help="Follow the deployments until they finish and exit with their result.",
+)
+@click.option(
+    "--wait-timeout",
+    default=None,
+    type=click.FloatRange(min=1),
+    help="Give up waiting after this many seconds.",
+)
 @validate_credentials(check_project_set=True)
-def deploy(project, branch, target):
+def deploy(
+    project,
+    branches=(),
+    targets=(),
+    batch_file=None,
+    concurrency=4,
+    retries=2,
+    as_json=False,
+    wait=False,
+    wait_timeout=None,
+):
     """
     Deploy a branch to a target environment.
 
@@ -77,10 +383,49 @@ def deploy(project, branch, target):
     The command will display deployable branches with their available targets, initiate the deployment process,
     and show the deployment progress.
 
+    To deploy many branches at once without prompts, repeat --branch/--target or pass a
+    --batch file. Deployments are then dispatched concurrently and summarized in a table
+    (or JSON with --json or `cased --output json|ndjson`).
+
+    With --wait, the command follows the dispatched deployments in a live table
+    and exits with status 0 only if all of them succeeded.
+
     Examples:
         cased deploy
         cased deploy --branch feature-branch-1 --target dev
+        cased deploy --branch pr-1 --branch pr-2 --target preview
+        cased deploy --batch deploys.yaml --concurrency 8 --json
+        cased deploy --branch feature-branch-1 --target dev --wait
+
+    A batch file lists branch/target pairs:
+
+    \b
+        deploys:
+          - branch: feature-branch-1
+            target: preview
+          - branch: feature-branch-2
+            target: preview
     """  # noqa: E501
+    if as_json:
+        # --json is `--output json` for this command, so --wait's live table
+        # also stays off stdout.
+        configure_output("json")
+    # A single deploy in a machine-readable format is reported like a batch.
+    single_json = machine_output() and len(branches) == 1 and len(targets) == 1
+    if batch_file or len(branches) > 1 or len(targets) > 1 or single_json:
+        pairs = []
+        if branches or targets:
+            pairs.extend(pair_branches_and_targets(branches, targets))
+        if batch_file:
+            pairs.extend(load_batch_file(batch_file))
+        if not pairs:
+            console.print("[red]Error: No deployments to dispatch.[/red]")
+            sys.exit(1)
+        deploy_batch(project, pairs, concurrency, retries, as_json, wait, wait_timeout)
+        return
+
+    branch = branches[0] if branches else None
+    target = targets[0] if targets else None
     if not branch and not target:
         branch, target = _build_questionary_choices(project)
 
@@ -89,7 +434,12 @@ def deploy(project, branch, target):
     )
 
     if branch and target:
+        dispatched_at = datetime.now(timezone.utc)
         CasedAPI().deploy_branch(project, branch, target)
         console.print("[green]Dispatch succeeded. Starting deployment...[/green]")
+        if wait:
+            wait_for_deployments(
+                project, [(branch, target)], dispatched_at, timeout=wait_timeout
+            )
     else:
         console.print("[red]Deployment dispatch failed. Please try again later.[/red]")
@@ -5,6 +5,11 @@ import inquirer
 import yaml
 from cased_cli.utils.auth import validate_credentials
 from cased_cli.utils.progress import run_process_with_status_bar
+from cased_cli.utils.project_config import (
+    CONFIG_PATH,
+    load_project_config,
+    validate_project_config,
+)
 from rich.console import Console
 from rich.panel import Panel
 
@@ -61,6 +66,8 @@ def get_environment_info():
     if answers["language"] == "Python":
         environment["environment"]["dependency_manager"] = "poetry"
         environment["environment"]["python_version"] = "[REQUIRED] <PYTHON_VERSION>"
+    else:
+        environment["environment"]["dependency_manager"] = "npm"
 
     return environment
 
@@ -72,6 +79,11 @@ def get_deployment_info():
             message="Select your deployment target",
             choices=["AWS", "Custom"],
         ),
+        inquirer.Confirm(
+            "rollout",
+            message="Deploy to several instances with a rolling rollout?",
+            default=False,
+        ),
     ]
 
     answers = inquirer.prompt(questions)
@@ -81,6 +93,14 @@ def get_deployment_info():
             "provider": answers["deployment_target"],
         },
     }
+    if answers["rollout"]:
+        # Hosts (the EC2_HOSTS secret) are deployed in parallel batches of
+        # min(batch_size, max_unavailable), each health-checked before the next.
+        deployment_info["cloud_deployment"]["rollout"] = {
+            "batch_size": 2,
+            "max_unavailable": 2,
+            "health_check": {"path": "/", "port": 80, "retries": 10, "interval": 5},
+        }
 
     return deployment_info
 
@@ -110,6 +130,8 @@ def check_for_docker(config):
                 "<ENV_VAR2>=<VALUE2>",
             ],
             "ports": ["[OPTIONAL] <HOST_PORT>:<CONTAINER_PORT>"],
+            # BuildKit layer cache; backend is "registry" (ECR) or "gha".
+            "cache": {"enabled": True, "backend": "registry", "mode": "max"},
         }
     else:
         config["docker"] = {"enabled": False}
@@ -135,6 +157,9 @@ def expand_config_with_placeholders(config):
                 "stop": "<STOP_COMMAND>",
                 "restart": "<RESTART_COMMAND>",
             },
+            # How the code reaches the instance: "rsync" transfers only what
+            # changed, "artifact" ships a single tarball.
+            "sync": {"method": "rsync", "compress": True},
         }
 
     config["cloud_deployment"] = config.get("cloud_deployment", {})
@@ -190,8 +215,8 @@ def write_config_file(config):
 # If you need help, refer to the documentation or run 'cased --help'.
 
         """  # noqa: E501
-    os.makedirs(".cased", exist_ok=True)
-    with open(".cased/config.yaml", "w") as f:
+    os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+    with open(CONFIG_PATH, "w") as f:
         f.write(f"{comments}\n")
         for section, content in config.items():
             yaml.dump({section: content}, f, default_flow_style=False)
@@ -212,11 +237,20 @@ def display_results():
     )
     console.print("Configuration file: [bold].cased/config.yaml[/bold]")
 
+    errors = validate_project_config(load_project_config(CONFIG_PATH))
+    if errors:
+        console.print("\n[bold red]The generated configuration is invalid:[/bold red]")
+        for error in errors:
+            console.print(f"- {error}")
+
     console.print("\n[bold yellow]Next steps:[/bold yellow]")
     console.print("1. Review and edit the configuration files in the .cased directory.")
     console.print(
         "2. Replace all placeholder values (enclosed in < >) with your actual configuration."  # noqa: E501
     )
     console.print(
-        "3. Once you've updated the config, run [bold]'cased build'[/bold] to generate your GitHub Actions workflow."  # noqa: E501
+        "3. Run [bold]'cased validate'[/bold] to check the updated configuration."
+    )
+    console.print(
+        "4. Once you've updated the config, run [bold]'cased build'[/bold] to generate your GitHub Actions workflow."  # noqa: E501
     )
@@ -34,6 +34,7 @@ import click
 from cased_cli.commands.resources import projects
 from cased_cli.utils.api import validate_tokens
 from cased_cli.utils.auth import validate_credentials
+from cased_cli.utils.cache import get_response_cache
 from cased_cli.utils.config import delete_config, save_config
 from cased_cli.utils.constants import CasedConstants
 from rich.console import Console
@@ -122,6 +123,7 @@ def logout():
     effectively logging you out of the Cased CLI.
     """
     delete_config()
+    get_response_cache().invalidate()
     console.print(
         Panel("[bold green]Logged out successfully![/bold green]", expand=False)
     )
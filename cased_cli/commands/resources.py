@@ -32,20 +32,23 @@ Date: 10/01/2024
 Version: 1.0.0
 """  # noqa: E501
 
+import asyncio
+from itertools import islice
+
 import click
 import questionary
-from cased_cli.utils.api import CasedAPI
+from cased_cli.utils.api import AsyncCasedAPI, CasedAPI
 from cased_cli.utils.auth import validate_credentials
 from cased_cli.utils.config import load_config, save_config
 from cased_cli.utils.constants import CasedConstants
+from cased_cli.utils.output import emit_rows, machine_output
 from cased_cli.utils.progress import run_process_with_status_bar
-from dateutil import parser
+from cased_cli.utils.tracing import span
 from questionary import Style
-from rich import box
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+
+# Table rendering (rich.table, rich.text, dateutil...) is imported inside the
+# table code paths, so --output json/ndjson never loads it.
 
 console = Console()
 
@@ -90,6 +93,8 @@ def projects(details=True):
     The selected project's name and ID are stored as environment variables for future use.
 
     Use the --details or --d option to show detailed information about each project, by default it is set to True.
+
+    With --output json or ndjson, the projects are printed and no project is selected.
     """  # noqa: E501
     # Check if a project is already selected
     config = load_config()
@@ -111,6 +116,17 @@ def projects(details=True):
         for project in raw_projects["projects"]
     ]
 
+    if machine_output():
+        emit_rows(
+            {**project, "current": str(project["id"]) == current_project_id}
+            for project in projects
+        )
+        return
+
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
     if details:
         table = Table(title="Projects Details", box=box.ROUNDED)
         table.add_column("Repository", style="magenta")
@@ -126,7 +142,8 @@ def projects(details=True):
                 style=row_style,
             )
 
-        console.print(table)
+        with span("render"):
+            console.print(table)
 
     if current_project_name and current_project_id:
         console.print(
@@ -196,45 +213,35 @@ def deployments(limit, project, target):
     Use the --limit option to specify the number of deployments to display.
     Use the --project and --target options to filter deployments by project and target.
     """
-    data = (
-        CasedAPI()
-        .get_deployments(project_name=project, target_name=target)
-        .get("deployments", [])
+    # Only the first `limit` deployments are requested and parsed.
+    data = islice(
+        CasedAPI().iter_deployments(
+            project_name=project, target_name=target, page_size=limit
+        ),
+        limit,
     )
-    if not data:
-        console.print("[red]No deployments available.[/red]")
+
+    if machine_output():
+        # Rows stream in API order; only the table below is sorted by begin
+        # time, since it is built in memory anyway.
+        emit_rows(_deployment_row(deployment) for deployment in data)
         return
 
+    from dateutil import parser
+    from rich.table import Table
+    from rich.text import Text
+
     deployments_data = []
-    for idx, deployment in enumerate(data):
-        if idx == limit:
-            break
-        begin_time = parser.parse(deployment.get("start_time"))
-        end_time = (
-            parser.parse(deployment.get("end_time"))
-            if deployment.get("end_time")
-            else ""
-        )
-        status = deployment.get("status", "Unknown")
-        deployment_id = deployment.get("id")
-        view_url = f"{CasedConstants.API_BASE_URL}/deployments/{deployment_id}"
-        deployer_full_name = (
-            f"{deployment.get('deployer').get('first_name')} {deployment.get('deployer').get('last_name')}"  # noqa: E501
-            if deployment.get("deployer")
-            else "Unknown"
+    for deployment in map(_deployment_row, data):
+        deployment["begin_time"] = parser.parse(deployment["begin_time"])
+        deployment["end_time"] = (
+            parser.parse(deployment["end_time"]) if deployment["end_time"] else ""
         )
+        deployments_data.append(deployment)
 
-        deployments_data.append(
-            {
-                "begin_time": begin_time,
-                "end_time": end_time,
-                "deployer": deployer_full_name,
-                "status": status,
-                "branch": deployment.get("ref").replace("refs/heads/", ""),
-                "target": deployment.get("target").get("name"),
-                "view": (deployment_id, view_url),
-            }
-        )
+    if not deployments_data:
+        console.print("[red]No deployments available.[/red]")
+        return
 
     # Sort deployments by start time in descending order
     deployments_data.sort(key=lambda x: x["begin_time"], reverse=True)
@@ -262,27 +269,62 @@ def deployments(limit, project, target):
             deployment["status"],
             deployment["branch"],
             deployment["target"],
-            Text(
-                f"View {deployment['view'][0]}", style=f"link {deployment['view'][1]}"
-            ),
+            Text(f"View {deployment['id']}", style=f"link {deployment['url']}"),
         )
 
-    console.print(table)
+    with span("render"):
+        console.print(table)
+
+
+def _deployment_row(deployment):
+    deployment_id = deployment.get("id")
+    deployer = deployment.get("deployer")
+    return {
+        "id": deployment_id,
+        "begin_time": deployment.get("start_time"),
+        "end_time": deployment.get("end_time"),
+        "deployer": (
+            f"{deployer.get('first_name')} {deployer.get('last_name')}"
+            if deployer
+            else "Unknown"
+        ),
+        "status": deployment.get("status", "Unknown"),
+        "branch": deployment.get("ref").replace("refs/heads/", ""),
+        "target": deployment.get("target").get("name"),
+        "url": f"{CasedConstants.API_BASE_URL}/deployments/{deployment_id}",
+    }
 
 
 @click.command()
 @click.option("--project", default="", help="Project name to filter branches")
+@click.option(
+    "--all-projects",
+    is_flag=True,
+    default=False,
+    help="Show target environments for every project",
+)
 @validate_credentials(check_project_set=True)
-def targets(project):
+def targets(project, all_projects=False):
     """
     Display target environments.
 
     This command shows a list of target environments for the selected project.
-    """
+    Use the --all-projects option to fetch the targets of every project concurrently.
+    """  # noqa: E501
+    if all_projects:
+        _all_projects_targets()
+        return
+
     data = run_process_with_status_bar(
         CasedAPI().get_targets, "Fetching targets...", timeout=10, project_name=project
     )
     targets = data.get("targets", [])
+    if machine_output():
+        emit_rows({"name": target.get("name")} for target in targets)
+        return
+
+    from rich.table import Table
+
     if not targets:
         console.print("[red]No targets available.[/red]")
         return
@@ -296,7 +338,57 @@ def targets(project):
             target.get("name"),
         )
 
-    console.print(table)
+    with span("render"):
+        console.print(table)
+
+
+def _all_projects_targets():
+    project_names = [
+        project["repository_full_name"]
+        for project in CasedAPI().get_projects()["projects"]
+    ]
+    results = run_process_with_status_bar(
+        lambda: asyncio.run(AsyncCasedAPI().map_projects("get_targets", project_names)),
+        f"Fetching targets for {len(project_names)} projects...",
+        timeout=30,
+    )
+
+    if machine_output():
+        emit_rows(_all_projects_target_rows(results))
+        return
+
+    from rich.table import Table
+    from rich.text import Text
+
+    table = Table(title="Targets")
+    table.add_column("Project", style="magenta")
+    table.add_column("Name", style="cyan")
+
+    for project_name, data in results.items():
+        if isinstance(data, Exception):
+            table.add_row(
+                project_name, Text(f"Error: {_error_summary(data)}", style="red")
+            )
+            continue
+        for target in data.get("targets", []):
+            table.add_row(project_name, target.get("name"))
+
+    with span("render"):
+        console.print(table)
+
+
+def _error_summary(error):
+    """The first line of an error's message, or its repr if the message is empty."""
+    return (str(error).splitlines() or [repr(error)])[0]
+
+
+def _all_projects_target_rows(results):
+    for project_name, data in results.items():
+        if isinstance(data, Exception):
+            yield {"project": project_name, "error": _error_summary(data)}
+            continue
+        for target in data.get("targets", []):
+            yield {"project": project_name, "name": target.get("name")}
 
 
 @click.command()
@@ -313,14 +405,30 @@ def branches(limit, project):
     Use the --limit option to specify the number of branches to display.
     Use the --project option to filter branches by project.
     """
-    data = run_process_with_status_bar(
-        CasedAPI().get_branches,
+    if machine_output():
+        # Rows are printed as pages arrive instead of after the whole fetch.
+        emit_rows(
+            map(
+                _branch_row,
+                islice(
+                    CasedAPI().iter_branches(project_name=project, page_size=limit),
+                    limit,
+                ),
+            )
+        )
+        return
+
+    from rich.table import Table
+
+    branches = run_process_with_status_bar(
+        lambda: list(
+            islice(
+                CasedAPI().iter_branches(project_name=project, page_size=limit), limit
+            )
+        ),
         "Fetching branches...",
         timeout=10,
-        project_name=project,
     )
-    branches = data.get("pull_requests", [])
-    print(len(branches))
 
     table = Table(title="Active Branches")
 
@@ -331,10 +439,7 @@ def branches(limit, project):
     table.add_column("Deployable", style="blue")
     table.add_column("Mergeable", style="blue")
     table.add_column("Checks", style="cyan")
-    for idx, branch in enumerate(branches):
-        if idx == limit:
-            break
-
+    for branch in branches:
         table.add_row(
             branch.get("branch_name"),
             branch.get("owner"),
@@ -351,4 +456,19 @@ def branches(limit, project):
             ),
         )
 
-    console.print(table)
+    with span("render"):
+        console.print(table)
+
+
+def _branch_row(branch):
+    return {
+        "name": branch.get("branch_name"),
+        "author": branch.get("owner"),
+        "number": branch.get("number"),
+        "title": branch.get("title"),
+        "deployable": branch.get("deployable"),
+        "mergeable": branch.get("mergeable"),
+        "approved": branch.get("approved"),
+        "up_to_date": branch.get("up_to_date"),
+        "checks_passing": branch.get("checks_passing"),
+    }
@@ -0,0 +1,83 @@
+import sys
+
+import click
+import yaml
+from cased_cli.utils.project_config import (
+    CONFIG_PATH,
+    discover_configs,
+    load_project_config,
+    validate_project_config,
+)
+from rich.console import Console
+
+console = Console()
+
+
+@click.command()
+@click.argument("paths", nargs=-1, type=click.Path(dir_okay=False))
+@click.option(
+    "--all",
+    "validate_all",
+    is_flag=True,
+    default=False,
+    help="Validate every .cased/config.yaml found in the repository.",
+)
+@click.option(
+    "--secrets",
+    "list_secrets",
+    is_flag=True,
+    default=False,
+    help="Also list the GitHub secrets the generated workflow can reference.",
+)
+def validate(paths, validate_all, list_secrets):
+    """
+    Validate .cased/config.yaml without generating anything.
+
+    All problems in a configuration are reported at once. Pass one or more
+    PATHS to validate specific files, or use --all to validate every service
+    configuration in a monorepo. With --secrets, the secrets each valid
+    configuration's workflow template can reference are listed, read from
+    the template without rendering it.
+
+    Examples:
+        cased validate
+        cased validate services/api/.cased/config.yaml
+        cased validate --all --secrets
+    """
+    if validate_all:
+        paths = discover_configs()
+    elif not paths:
+        paths = [CONFIG_PATH]
+
+    if not paths:
+        console.print("[red]Error: No .cased/config.yaml files found.[/red]")
+        sys.exit(1)
+
+    failed = False
+    for path in paths:
+        try:
+            config = load_project_config(path)
+            errors = validate_project_config(config)
+        except OSError as e:
+            errors = [f"Cannot read file: {e.strerror}"]
+        except yaml.YAMLError as e:
+            errors = [f"Invalid YAML: {e}"]
+
+        if errors:
+            failed = True
+            console.print(f"[red]✗ {path}[/red]")
+            for error in errors:
+                console.print(f"    - {error}")
+        else:
+            console.print(f"[green]✓ {path}[/green]")
+            if list_secrets:
+                from cased_cli.commands.build import (
+                    extract_secrets_from_template,
+                    template_name_for,
+                )
+
+                secrets = extract_secrets_from_template(template_name_for(config))
+                console.print(f"    secrets: {', '.join(secrets)}")
+
+    if failed:
+        sys.exit(1)
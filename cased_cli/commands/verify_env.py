@@ -1,9 +1,103 @@
+import hashlib
+import json
 import os
-import click
+import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+import click
 from rich import print
-import re
+
+from cased_cli.utils.git import get_changed_files, get_head_commit
+
+
+class EnvIndex:
+    """
+    Persistent per-file scan results, so unchanged files are not re-read.
+
+    Entries are keyed by relative path and validated by mtime and size. When
+    those changed but the content hash did not (e.g. after a checkout), the
+    stored variables are reused without running the regex again. The commit
+    HEAD pointed to when the index was written is recorded too, so changed
+    files can be found by diffing against it.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: Path, signature: str):
+        self.path = path
+        self.signature = signature
+        self.files = {}
+        self.commit = None
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION and data.get("signature") == signature:
+            self.files = data.get("files", {})
+            self.commit = data.get("commit")
+
+    def lookup(self, rel_path: str, stat: os.stat_result):
+        entry = self.files.get(rel_path)
+        if (
+            entry
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return set(entry["vars"])
+        return None
+
+    def lookup_digest(self, rel_path: str, digest: str):
+        entry = self.files.get(rel_path)
+        if entry and entry["sha256"] == digest:
+            return set(entry["vars"])
+        return None
+
+    def update(self, rel_path: str, stat: os.stat_result, digest: str, file_vars: set):
+        self.files[rel_path] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "vars": sorted(file_vars),
+        }
+        self.dirty = True
+
+    def remove(self, rel_path: str):
+        if self.files.pop(rel_path, None) is not None:
+            self.dirty = True
+
+    def set_commit(self, commit):
+        if commit != self.commit:
+            self.commit = commit
+            self.dirty = True
+
+    def retain(self, rel_paths: set):
+        """Drop entries for files that are no longer part of the scan."""
+        for rel_path in set(self.files) - rel_paths:
+            self.remove(rel_path)
+
+    def save(self):
+        if not self.dirty:
+            return
+        data = {
+            "version": self.VERSION,
+            "signature": self.signature,
+            "commit": self.commit,
+            "files": self.files,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            # The index is only an optimization; a failed write means a full rescan.
+            pass
+
 
 class EnvChecker:
     PYTHON_PATHS = [
@@ -15,19 +109,34 @@ class EnvChecker:
         "**/env.py",
     ]
 
-    EXCLUDE_PATTERNS = [
-        "*/.*",
-        "*/venv/*",
-        "*/__pycache__/*",
-        "*/dist/*",
-        "*/.git/*"
-    ]
+    # Directories never descended into. Hidden directories (.git, .venv, ...)
+    # are always skipped as well.
+    EXCLUDE_DIRS = {
+        "venv",
+        "__pycache__",
+        "dist",
+        "node_modules",
+    }
+
+    ENV_VAR_PATTERN = re.compile(
+        r"os\.environ\.get\(['\"]([A-Z_]*)['\"].*?\)|os\.environ\[['\"]([A-Z_]*)['\"]|os\.getenv\(['\"]([A-Z_]*)['\"]"
+    )
 
-    def __init__(self, verbose=False):
+    INDEX_PATH = ".cased/cache/env-index"
+
+    def __init__(self, verbose=False, root=None, max_workers=None, use_index=True):
         self.temp_dir = tempfile.mkdtemp()
         self.env_vars_file = Path(self.temp_dir) / "env_example_vars.txt"
         self.verbose = verbose
-        self.cwd = Path.cwd()
+        self.cwd = Path(root) if root else Path.cwd()
+        self.max_workers = max_workers
+        self.path_matcher = self._compile_path_patterns(self.PYTHON_PATHS)
+        self.index = None
+        if use_index:
+            signature = hashlib.sha256(
+                f"{self.ENV_VAR_PATTERN.pattern}\n{self.path_matcher.pattern}".encode()
+            ).hexdigest()
+            self.index = EnvIndex(self.cwd / self.INDEX_PATH, signature)
 
     def cleanup(self):
         """Clean up temporary files"""
@@ -49,36 +158,155 @@ class EnvChecker:
                     var = line.split('=')[0].strip()
                     out.write(f"{var}\n")
 
-    def scan_files(self, pattern: str) -> set:
-        """Scan Python files for environment variables and return found vars."""
-        python_pattern = r"os\.environ\.get\(['\"]([A-Z_]*)['\"].*?\)|os\.environ\[['\"]([A-Z_]*)['\"]|os\.getenv\(['\"]([A-Z_]*)['\"]"
-        
-        found_vars = set()
-        for file in self.cwd.glob(pattern.lstrip('/')):
-            if any(file.match(exclude) for exclude in self.EXCLUDE_PATTERNS):
-                continue
+    @staticmethod
+    def _compile_path_patterns(patterns) -> re.Pattern:
+        """Compile glob patterns (with ** support) into one relative-path regex."""
+        regexes = []
+        for pattern in patterns:
+            parts = []
+            for segment in pattern.strip('/').split('/'):
+                if segment == '**':
+                    parts.append(r"(?:[^/]+/)*")
+                else:
+                    segment = (
+                        re.escape(segment)
+                        .replace(r"\*", "[^/]*")
+                        .replace(r"\?", "[^/]")
+                    )
+                    parts.append(segment + "/")
+            regexes.append("".join(parts).rstrip("/"))
+        return re.compile("^(?:" + "|".join(regexes) + ")$")
 
+    def find_files(self) -> list:
+        """
+        Walk the tree once and return the files matching any of PYTHON_PATHS.
+
+        Excluded and hidden directories are pruned before descending into them.
+        """
+        matched = []
+        stack = [(str(self.cwd), "")]
+        while stack:
+            directory, rel_dir = stack.pop()
             try:
-                with open(file) as f:
-                    content = f.read()
-                    matches = re.finditer(python_pattern, content)
-                    for match in matches:
-                        var_name = next((g for g in match.groups() if g), None)
-                        if var_name:
-                            found_vars.add(var_name)
-                            if self.verbose:
-                                print(f"Found {var_name} in {file.relative_to(self.cwd)}")
-            except Exception as e:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.'):
+                            continue
+                        rel_path = f"{rel_dir}{entry.name}"
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.EXCLUDE_DIRS:
+                                stack.append((entry.path, rel_path + "/"))
+                        elif self.path_matcher.match(rel_path) and entry.is_file():
+                            matched.append(Path(entry.path))
+            except OSError as e:
                 if self.verbose:
-                    print(f"[red]Error reading {file}: {str(e)}[/red]")
-        
+                    print(f"[red]Error reading {directory}: {str(e)}[/red]")
+        return sorted(matched)
+
+    def _is_excluded(self, rel_path: str) -> bool:
+        parts = rel_path.split('/')
+        return any(p.startswith('.') for p in parts) or any(
+            p in self.EXCLUDE_DIRS for p in parts[:-1]
+        )
+
+    def find_changed_files(self):
+        """
+        Return the files to scan when only git-changed files need rescanning:
+        everything already in the index plus files matching PYTHON_PATHS that
+        changed since the commit the index was written at. Returns None when a
+        full walk is needed instead (no index yet, not a git repository, or
+        the recorded commit is unknown).
+        """
+        if self.index is None or not self.index.files or not self.index.commit:
+            return None
+        changed = get_changed_files(self.cwd, since=self.index.commit)
+        if changed is None:
+            return None
+
+        rel_paths = set(self.index.files)
+        for rel_path in changed:
+            if self._is_excluded(rel_path) or not self.path_matcher.match(rel_path):
+                continue
+            rel_paths.add(rel_path)
+        return sorted(self.cwd / rel_path for rel_path in rel_paths)
+
+    def scan_content(self, content: str) -> set:
+        """Return the environment variables referenced in `content`."""
+        return {
+            next(g for g in match.groups() if g)
+            for match in self.ENV_VAR_PATTERN.finditer(content)
+            if any(match.groups())
+        }
+
+    def scan_file(self, file: Path) -> set:
+        """Return the environment variables referenced in a single file."""
+        with open(file) as f:
+            return self.scan_content(f.read())
+
+    def _scan_file_safe(self, file: Path):
+        """
+        Scan a file in a worker thread, reusing its index entry when possible.
+
+        Returns (vars, index_update, error); index_update is a (stat, digest)
+        pair when the index entry needs to be written, applied by the caller.
+        """
+        try:
+            if self.index is None:
+                return self.scan_file(file), None, None
+
+            rel_path = file.relative_to(self.cwd).as_posix()
+            stat = file.stat()
+            file_vars = self.index.lookup(rel_path, stat)
+            if file_vars is not None:
+                return file_vars, None, None
+
+            with open(file, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            file_vars = self.index.lookup_digest(rel_path, digest)
+            if file_vars is None:
+                file_vars = self.scan_content(data.decode())
+            return file_vars, (stat, digest), None
+        except Exception as e:
+            return set(), None, e
+
+    def scan_files(self, files=None) -> set:
+        """Scan Python files for environment variables and return found vars."""
+        if files is None:
+            files = self.find_files()
+
+        found_vars = set()
+        scanned = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self._scan_file_safe, files)
+            for file, result in zip(files, results, strict=True):
+                file_vars, index_update, error = result
+                rel_path = file.relative_to(self.cwd).as_posix()
+                if isinstance(error, FileNotFoundError):
+                    continue
+                if error is not None:
+                    if self.verbose:
+                        print(f"[red]Error reading {file}: {str(error)}[/red]")
+                    continue
+                scanned.add(rel_path)
+                if index_update is not None:
+                    self.index.update(rel_path, *index_update, file_vars)
+                found_vars.update(file_vars)
+                if self.verbose:
+                    for var_name in sorted(file_vars):
+                        print(f"Found {var_name} in {rel_path}")
+
+        if self.index is not None:
+            self.index.retain(scanned)
+            self.index.set_commit(get_head_commit(self.cwd))
+            self.index.save()
         return found_vars
 
     def get_env_example_vars(self) -> set:
         """Get all variables from .env.example file."""
         env_vars = set()
         env_example = self.cwd / ".env.example"
-        
+
         if not env_example.exists():
             if self.verbose:
                 print("[yellow]Warning: No .env.example file found[/yellow]")
@@ -89,10 +317,10 @@ class EnvChecker:
                 if line.strip() and not line.startswith('#') and '=' in line:
                     var = line.split('=')[0].strip()
                     env_vars.add(var)
-        
+
         return env_vars
 
-    def check_missing_vars(self) -> bool:
+    def check_missing_vars(self, changed_only=False) -> bool:
         """Check for missing required variables."""
         # Get all variables from .env.example
         env_example_vars = self.get_env_example_vars()
@@ -100,9 +328,8 @@ class EnvChecker:
             print("[yellow]⚠️  No variables found in .env.example[/yellow]")
             return False
 
-        settings_vars = set()
-        for pattern in self.PYTHON_PATHS:
-            settings_vars.update(self.scan_files(pattern))
+        files = self.find_changed_files() if changed_only else None
+        settings_vars = self.scan_files(files)
 
         # Get current OS environment variables (excluding system ones)
         system_vars = {
@@ -111,7 +338,11 @@ class EnvChecker:
             'COLORTERM', 'TERM_PROGRAM', 'OLDPWD', 'ZSH', 'PAGER',
             'LESS', 'LOGNAME', 'DISPLAY', 'SECURITYSESSIONID', 'TMPDIR'
         }
-        os_vars = {var for var in os.environ if not any(var.startswith(s) for s in system_vars)}
+        os_vars = {
+            var
+            for var in os.environ
+            if not any(var.startswith(s) for s in system_vars)
+        }
 
         print("\nRequired but not set:")
         print("--------------------")
@@ -119,7 +350,8 @@ class EnvChecker:
 
         # Check each variable from .env.example
         for var in sorted(env_example_vars):
-            # Variable is missing if it's not in OS environment and not in any settings file
+            # Variable is missing if it's neither in the OS environment nor in
+            # any settings file
             if var not in os_vars and var not in settings_vars:
                 print(f"[red]❌ {var}[/red]")
                 missing_found = True
@@ -130,12 +362,20 @@ class EnvChecker:
         return missing_found
 
 @click.command()
-@click.option('-v', '--verbose', is_flag=True, help='Show detailed information about the scan')
-def verify_env(verbose):
+@click.option(
+    '-v', '--verbose', is_flag=True, help='Show detailed information about the scan'
+)
+@click.option(
+    '--changed-only',
+    is_flag=True,
+    help='Skip the directory walk and only rescan files git reports as changed since '
+    'the last scan, reusing indexed results for everything else',
+)
+def verify_env(verbose, changed_only):
     """Check for missing required environment variables in the current directory."""
     checker = EnvChecker(verbose=verbose)
     try:
-        missing_found = checker.check_missing_vars()
+        missing_found = checker.check_missing_vars(changed_only=changed_only)
         if missing_found:
             raise click.ClickException("Missing required environment variables")
     finally:
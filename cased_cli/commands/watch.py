@@ -0,0 +1,255 @@
+import sys
+import time
+from datetime import timedelta, timezone
+from itertools import islice
+
+import click
+from cased_cli.utils.api import CasedAPI
+from cased_cli.utils.auth import validate_credentials
+from cased_cli.utils.constants import CasedConstants
+from cased_cli.utils.output import machine_output
+from dateutil import parser
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+console = Console()
+
+# How many of the most recent deployments each poll looks at.
+POLL_PAGE_SIZE = 50
+# Polls after which a deployment that never showed up is reported missing.
+MISSING_POLLS = 10
+# Tolerance for clock skew between this machine and the server when matching a
+# freshly dispatched deployment by its start time.
+CLOCK_SKEW = timedelta(seconds=60)
+
+
+def deployment_state(deployment):
+    """Return "success", "failure" or "running" for a deployment."""
+    status = str(deployment.get("status", "")).lower()
+    if status in CasedConstants.DEPLOYMENT_SUCCESS_STATUSES:
+        return "success"
+    if status in CasedConstants.DEPLOYMENT_FAILURE_STATUSES:
+        return "failure"
+    return "running"
+
+
+class WatchedDeployment:
+    """A deployment being watched, identified by id or by branch/target."""
+
+    def __init__(self, deployment_id=None, branch=None, target=None, since=None):
+        self.deployment_id = str(deployment_id) if deployment_id else None
+        self.branch = branch
+        self.target = target
+        self.since = since
+        self.deployment = None
+        self.missed_polls = 0
+        self.missing = False
+
+    @property
+    def label(self):
+        if self.deployment_id:
+            return self.deployment_id
+        return f"{self.branch} -> {self.target}"
+
+    @property
+    def state(self):
+        if self.deployment:
+            return deployment_state(self.deployment)
+        return "missing" if self.missing else "pending"
+
+    @property
+    def finished(self):
+        return self.state in ("success", "failure", "missing")
+
+    def miss(self):
+        """Record a poll that did not find the deployment; True once missing."""
+        self.missed_polls += 1
+        self.missing = self.missed_polls >= MISSING_POLLS
+        return self.missing
+
+    def matches(self, deployment):
+        if self.deployment_id:
+            return str(deployment.get("id")) == self.deployment_id
+
+        ref = (deployment.get("ref") or "").replace("refs/heads/", "")
+        target = (deployment.get("target") or {}).get("name")
+        if ref != self.branch or target != self.target:
+            return False
+        if self.since and deployment.get("start_time"):
+            start_time = parser.parse(deployment["start_time"])
+            if start_time.tzinfo is None:
+                start_time = start_time.replace(tzinfo=timezone.utc)
+            return start_time >= self.since - CLOCK_SKEW
+        return True
+
+
+class DeploymentWatcher:
+    """
+    Follow any number of deployments of a project with a single poll loop.
+
+    Every watched deployment, by id or by branch/target, is matched against
+    the project's most recent deployments, fetched once per poll with a
+    conditional request so unchanged lists cost a 304. A deployment that is
+    still not among them after MISSING_POLLS polls is reported missing, so the
+    loop always ends. The poll interval backs off
+    while nothing changes and resets as soon as a watched deployment changes
+    status.
+    """
+
+    def __init__(
+        self,
+        project,
+        api=None,
+        interval=2.0,
+        max_interval=30.0,
+        backoff=1.5,
+        timeout=None,
+    ):
+        self.project = project
+        self.api = api or CasedAPI()
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.watched = []
+
+    def add(self, deployment_id=None, branch=None, target=None, since=None):
+        self.watched.append(WatchedDeployment(deployment_id, branch, target, since))
+
+    @property
+    def done(self):
+        return all(w.finished for w in self.watched)
+
+    def poll(self):
+        """Refresh every watched deployment; return True if any status changed."""
+        pending = [w for w in self.watched if not w.finished]
+        if not pending:
+            return False
+        deployments = list(
+            islice(
+                self.api.iter_deployments(
+                    self.project, page_size=POLL_PAGE_SIZE, revalidate=True
+                ),
+                POLL_PAGE_SIZE,
+            )
+        )
+        changed = False
+        for watched in pending:
+            # The API lists the most recent deployments first.
+            match = next((d for d in deployments if watched.matches(d)), None)
+            if match is None:
+                if watched.miss():
+                    changed = True
+                continue
+            if watched.deployment is None or match.get("status") != (
+                watched.deployment.get("status")
+            ):
+                changed = True
+            watched.deployment = match
+        return changed
+
+    def render(self):
+        table = Table(title=f"Deployments for {self.project}")
+        table.add_column("Deployment", style="cyan")
+        table.add_column("Branch", style="yellow")
+        table.add_column("Target", style="blue")
+        table.add_column("Status")
+        state_styles = {"success": "green", "failure": "red", "missing": "red"}
+        for watched in self.watched:
+            deployment = watched.deployment or {}
+            if watched.missing:
+                status = "not found"
+            else:
+                status = deployment.get("status", "waiting for deployment...")
+            style = state_styles.get(watched.state, "yellow")
+            table.add_row(
+                str(deployment.get("id", watched.label)),
+                (deployment.get("ref") or watched.branch or "").replace(
+                    "refs/heads/", ""
+                ),
+                (deployment.get("target") or {}).get("name", watched.target or ""),
+                f"[{style}]{status}[/{style}]",
+            )
+        return table
+
+    def run(self):
+        """
+        Poll until every watched deployment finished or the timeout expired,
+        updating a live table in place. Returns True if all succeeded.
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        interval = self.interval
+        # Keep stdout free for JSON/NDJSON output.
+        live_console = Console(stderr=True) if machine_output() else console
+        with Live(self.render(), console=live_console, auto_refresh=False) as live:
+            while True:
+                changed = self.poll()
+                live.update(self.render(), refresh=True)
+                if self.done:
+                    break
+                if deadline and time.monotonic() >= deadline:
+                    live_console.print(
+                        f"[red]Timed out after {self.timeout} seconds waiting for deployments.[/red]"  # noqa: E501
+                    )
+                    return False
+
+                interval = (
+                    self.interval
+                    if changed
+                    else min(interval * self.backoff, self.max_interval)
+                )
+                if deadline:
+                    interval = min(interval, max(0, deadline - time.monotonic()))
+                time.sleep(interval)
+
+            missing = [w.label for w in self.watched if w.missing]
+            if missing:
+                live_console.print(
+                    f"[red]Deployments not found: {', '.join(missing)}[/red]"
+                )
+
+        return all(w.state == "success" for w in self.watched)
+
+
+def wait_for_deployments(project, pairs, since, timeout=None):
+    """Watch freshly dispatched (branch, target) deployments; exit with their result."""
+    watcher = DeploymentWatcher(project, timeout=timeout)
+    for branch, target in pairs:
+        watcher.add(branch=branch, target=target, since=since)
+    sys.exit(0 if watcher.run() else 1)
+
+
+@click.command()
+@click.argument("deployment_ids", nargs=-1, required=True)
+@click.option("--project", default="", help="Project the deployments belong to")
+@click.option(
+    "--interval",
+    default=2.0,
+    show_default=True,
+    type=click.FloatRange(min=0.5),
+    help="Initial seconds between polls; backs off while nothing changes.",
+)
+@click.option(
+    "--timeout",
+    default=None,
+    type=click.FloatRange(min=1),
+    help="Give up after this many seconds.",
+)
+@validate_credentials(check_project_set=True)
+def watch(deployment_ids, project, interval=2.0, timeout=None):
+    """
+    Watch deployments until they finish.
+
+    Shows a live table of the given deployments and exits with status 0 if
+    all of them succeeded, or 1 if any failed, was not found or the timeout
+    expired.
+
+    Examples:
+        cased watch 1234
+        cased watch 1234 1235 --timeout 600
+    """
+    watcher = DeploymentWatcher(project, interval=interval, timeout=timeout)
+    for deployment_id in deployment_ids:
+        watcher.add(deployment_id=deployment_id)
+    sys.exit(0 if watcher.run() else 1)
@@ -1,47 +1,283 @@
+import asyncio
+import time
+from functools import lru_cache, partial
+
 import requests
+from cased_cli.utils.cache import cache_enabled, cache_refresh, get_response_cache
 from cased_cli.utils.config import load_config
 from cased_cli.utils.constants import CasedConstants
 from cased_cli.utils.exception import CasedAPIError
+from cased_cli.utils.progress import check_cancelled, run_tasks, time_left
+from cased_cli.utils.tracing import span, traced_request
+from requests.adapters import HTTPAdapter
 from rich.console import Console
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
 
 console = Console()
 
+REQUEST_TIMEOUT = (
+    CasedConstants.HTTP_CONNECT_TIMEOUT,
+    CasedConstants.HTTP_READ_TIMEOUT,
+)
+
+
+class _CasedRetry(Retry):
+    """
+    Retry idempotent requests on 429/5xx, and non-idempotent ones (e.g. a branch
+    deploy dispatch) only when the server tells us it did not process them.
+    """
+
+    NOT_PROCESSED_STATUS_CODES = frozenset({429, 503})
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if (
+            method.upper() not in self.allowed_methods
+            and status_code in self.NOT_PROCESSED_STATUS_CODES
+            and self.total
+        ):
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+@lru_cache(maxsize=None)
+def get_session(retries: bool = True) -> requests.Session:
+    """
+    Return the process-wide HTTP session.
+
+    All API traffic goes through this session so that multi-call commands reuse
+    the same keep-alive connection instead of paying a new TCP+TLS handshake
+    per request.
+
+    With `retries=False` the session never retries on its own; it is used for
+    non-idempotent requests whose caller decides what is safe to retry.
+    """
+    retry = 0
+    if retries:
+        retry = _CasedRetry(
+            total=CasedConstants.HTTP_MAX_RETRIES,
+            # A read timeout already waited the full HTTP_READ_TIMEOUT; retrying
+            # it would multiply that wait. Connect errors and 429/5xx are retried.
+            read=0,
+            backoff_factor=CasedConstants.HTTP_BACKOFF_FACTOR,
+            backoff_max=CasedConstants.HTTP_MAX_BACKOFF,
+            status_forcelist=CasedConstants.HTTP_RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    adapter = HTTPAdapter(
+        pool_connections=CasedConstants.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=CasedConstants.HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def request_timeout():
+    """
+    The (connect, read) timeout of a request, capped to the time left before
+    the progress run it is part of times out, so it cannot outlive the run.
+    """
+    left = time_left()
+    if left is None:
+        return REQUEST_TIMEOUT
+    left = max(left, 0.1)
+    return tuple(min(timeout, left) for timeout in REQUEST_TIMEOUT)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Connection problems, rate limiting and server errors are worth retrying."""
+    if isinstance(error, CasedAPIError):
+        return error.status_code == 429 or (error.status_code or 0) >= 500
+    return isinstance(error, requests.RequestException)
+
+
+def is_unprocessed_error(error: Exception) -> bool:
+    """
+    Errors of requests that never reached the API: the connection could not be
+    set up, or the server answered 429/503 without processing the request.
+    Only these are safe to retry for non-idempotent calls such as a deploy; a
+    read timeout or a dropped connection may come after the server acted.
+    """
+    if isinstance(error, CasedAPIError):
+        return error.status_code in _CasedRetry.NOT_PROCESSED_STATUS_CODES
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if isinstance(error, requests.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+def call_with_retries(
+    func, *args, retries=2, backoff=0.5, retry_if=is_retryable_error, **kwargs
+):
+    """
+    Call `func`, retrying errors accepted by `retry_if` up to `retries` times
+    with exponential backoff. The last error is raised once retries are
+    exhausted.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == retries or not retry_if(e):
+                raise
+            time.sleep(backoff * 2**attempt)
+
 
 # This is a special case, at this moment, users have not logged in yet.
 # So leave it out of CasedAPI class.
 def validate_tokens(api_token, org_name):
-    return requests.post(
+    return traced_request(
+        get_session().request,
+        "POST",
         f"{CasedConstants.API_BASE_URL}/validate-token/",
         json={"api_token": api_token, "org_name": org_name},
+        timeout=REQUEST_TIMEOUT,
     )
 
 
 class CasedAPI:
     def __init__(self):
         configs = load_config(CasedConstants.ENV_FILE)
+        self.session = get_session()
         self.request_headers = {
             "Authorization": f"Bearer {str(configs.get(CasedConstants.CASED_API_AUTH_KEY))}",
             "Accept": "application/json",
         }
 
-    def _make_request(self, resource_name, method, url, **kwargs):
-        response = requests.request(method, url, headers=self.request_headers, **kwargs)
-        if response.status_code in [200, 201]:
-            return response.json()
-        else:
-            raise CasedAPIError(
-                f"Failed to fetch {resource_name} from {url}",
-                response.status_code,
-                response.json(),
+    def _send(self, method, url, headers=None, session=None, **kwargs):
+        kwargs.setdefault("timeout", request_timeout())
+        return traced_request(
+            (session or self.session).request,
+            method,
+            url,
+            headers={**self.request_headers, **(headers or {})},
+            **kwargs,
+        )
+
+    def _make_request(self, resource_name, method, url, revalidate=False, **kwargs):
+        """
+        Send a request and return its decoded JSON body.
+
+        GET requests for resources listed in CasedConstants.HTTP_CACHE_TTLS are
+        served from the local response cache while fresh, and revalidated with
+        If-None-Match/If-Modified-Since once stale (or always, if `revalidate`
+        is set or the CLI runs with --refresh).
+        """
+        with span(f"api {resource_name}", "api", method=method):
+            ttl = CasedConstants.HTTP_CACHE_TTLS.get(resource_name)
+            cache = None
+            entry = None
+            headers = {}
+            if method == "GET" and ttl is not None and cache_enabled():
+                cache = get_response_cache()
+                key = cache.make_key(
+                    method,
+                    url,
+                    kwargs.get("params"),
+                    self.request_headers["Authorization"],
+                )
+                entry = cache.get(resource_name, key)
+                if entry:
+                    if not (revalidate or cache_refresh()) and cache.is_fresh(
+                        entry, ttl
+                    ):
+                        return entry["body"]
+                    headers = cache.conditional_headers(entry)
+
+            response = self._send(method, url, headers=headers, **kwargs)
+            if response.status_code == 304 and entry:
+                cache.refresh(resource_name, key, entry)
+                return entry["body"]
+            if response.status_code in [200, 201]:
+                data = response.json() if response.content else {}
+                if cache is not None:
+                    cache.set(
+                        resource_name,
+                        key,
+                        data,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                return data
+            else:
+                try:
+                    response_body = response.json()
+                except ValueError:
+                    response_body = response.text
+                raise CasedAPIError(
+                    f"Failed to fetch {resource_name} from {url}",
+                    response.status_code,
+                    response_body,
+                )
+
+    def _paginate(
+        self,
+        resource_name,
+        url,
+        items_key,
+        params=None,
+        page_size=None,
+        revalidate=False,
+    ):
+        """
+        Lazily yield the items of a list endpoint, one page at a time.
+
+        The page size is sent as `limit` and the server's `next_cursor` is sent
+        back as `cursor` for the following page, so callers that stop iterating
+        early never download the remaining pages. Servers that ignore
+        pagination return everything in the first page and no cursor.
+        """
+        params = {**(params or {}), "limit": page_size or CasedConstants.API_PAGE_SIZE}
+        while True:
+            # Stop between pages when the progress run this is part of was
+            # cancelled (timeout, error or Ctrl-C).
+            check_cancelled()
+            data = self._make_request(
+                resource_name=resource_name,
+                method="GET",
+                url=url,
+                params=params,
+                revalidate=revalidate,
             )
+            items = data.get(items_key, [])
+            yield from items
+            cursor = data.get("next_cursor")
+            if not cursor or not items:
+                return
+            params = {**params, "cursor": cursor}
 
-    def get_branches(self, project_name):
+    def get_cached(self, resource_name, url, params=None):
+        """
+        Return the cached body of a GET request, however stale, without any
+        network I/O, or None if nothing is cached.
+        """
+        if not cache_enabled():
+            return None
+        cache = get_response_cache()
+        key = cache.make_key("GET", url, params, self.request_headers["Authorization"])
+        entry = cache.get(resource_name, key)
+        return entry["body"] if entry else None
+
+    def get_branches(self, project_name, revalidate=False):
         query_params = {"project_name": project_name}
         return self._make_request(
             resource_name="branches",
             method="GET",
             url=f"{CasedConstants.API_BASE_URL}/branches",
             params=query_params,
+            revalidate=revalidate,
+        )
+
+    def get_cached_branches(self, project_name):
+        return self.get_cached(
+            "branches",
+            f"{CasedConstants.API_BASE_URL}/branches",
+            {"project_name": project_name},
         )
 
     def get_projects(self):
@@ -69,40 +305,197 @@ class CasedAPI:
             params=params,
         )
 
-    def deploy_branch(self, project_name, branch_name, target_name):
+    def iter_branches(self, project_name, page_size=None):
+        return self._paginate(
+            resource_name="branches",
+            url=f"{CasedConstants.API_BASE_URL}/branches",
+            items_key="pull_requests",
+            params={"project_name": project_name},
+            page_size=page_size,
+        )
+
+    def iter_deployments(
+        self, project_name, target_name=None, page_size=None, revalidate=False
+    ):
+        return self._paginate(
+            resource_name="deployments",
+            url=f"{CasedConstants.API_BASE_URL}/deployments",
+            items_key="deployments",
+            params={"project_name": project_name, "target_name": target_name},
+            page_size=page_size,
+            revalidate=revalidate,
+        )
+
+    def _post_once(
+        self, resource_name, url, json, retries=CasedConstants.HTTP_MAX_RETRIES
+    ):
+        """
+        Send a non-idempotent POST so that the server acts on it at most once.
+
+        It goes out on the session without automatic retries and is only
+        retried, up to `retries` times, when it certainly never reached the
+        server (see is_unprocessed_error).
+        """
+        return call_with_retries(
+            self._make_request,
+            resource_name=resource_name,
+            method="POST",
+            url=url,
+            json=json,
+            session=get_session(retries=False),
+            retries=retries,
+            retry_if=is_unprocessed_error,
+        )
+
+    def deploy_branch(
+        self,
+        project_name,
+        branch_name,
+        target_name,
+        retries=CasedConstants.HTTP_MAX_RETRIES,
+    ):
         json = {
             "project_name": project_name,
             "branch_name": branch_name,
             "target_name": target_name,
         }
-        return self._make_request(
-            resource_name="branch_deploy",
-            method="POST",
-            url=f"{CasedConstants.API_BASE_URL}/branch-deploys",
-            json=json,
+        response = self._post_once(
+            "branch_deploy",
+            f"{CasedConstants.API_BASE_URL}/branch-deploys",
+            json,
+            retries=retries,
         )
+        # A new deployment makes cached deployment lists stale.
+        get_response_cache().invalidate("deployments")
+        return response
 
-    def create_secrets(self, project_name: str, secrets: list):
-        payload = {
-            "storage_destination": "github_repository",
-            "keys": [{"name": secret, "type": "credentials"} for secret in secrets],
-        }
-        response = requests.post(
-            f"{CasedConstants.API_BASE_URL}/api/v1/secrets/{project_name}/setup",
-            json=payload,
-            headers=self.request_headers,
+    def _secrets_url(self, project_name):
+        return f"{CasedConstants.API_BASE_URL}/api/v1/secrets/{project_name}/setup"
+
+    def get_secret_names(self, project_name):
+        data = self._make_request(
+            resource_name="secrets",
+            method="GET",
+            url=self._secrets_url(project_name),
         )
-        if response.status_code == 201:
-            console.print("[green]Secrets setup successful![/green]")
+        return {key["name"] for key in data.get("keys", [])}
+
+    def _setup_secrets(self, project_name, secrets):
+        return self._post_once(
+            "secrets",
+            self._secrets_url(project_name),
+            {
+                "storage_destination": "github_repository",
+                "keys": [{"name": secret, "type": "credentials"} for secret in secrets],
+            },
+        )
+
+    def create_secrets(self, project_name: str, secrets: list):
+        """
+        Set up the secrets that do not exist yet and return True on success.
+
+        Existing secret names are fetched once (falling back to setting up
+        every secret if that fails), and only the missing ones are sent, in
+        chunks of CasedConstants.SECRETS_BATCH_SIZE that are dispatched
+        concurrently and retried only when they never reached the server.
+        """
+        secrets = list(dict.fromkeys(secrets))
+        try:
+            existing = self.get_secret_names(project_name)
+        except (CasedAPIError, requests.RequestException):
+            existing = set()
+        new_secrets = [secret for secret in secrets if secret not in existing]
+        if not new_secrets:
             console.print(
-                f"Please go to {CasedConstants.API_BASE_URL}/secrets/{project_name} to update these secrets."  # noqa: E501
+                f"[green]All {len(secrets)} secrets are already set up.[/green]"
             )
-        else:
+            return True
+
+        size = CasedConstants.SECRETS_BATCH_SIZE
+        chunks = [new_secrets[i : i + size] for i in range(0, len(new_secrets), size)]
+        with span("api secrets", "api", method="POST", keys=len(new_secrets)):
+            results = run_tasks(
+                [
+                    (
+                        f"Setting up secrets ({index + 1}/{len(chunks)})...",
+                        partial(self._setup_secrets, project_name, chunk),
+                    )
+                    for index, chunk in enumerate(chunks)
+                ],
+                max_concurrency=CasedConstants.API_MAX_CONCURRENCY,
+                return_exceptions=True,
+            )
+
+        failed = [
+            secret
+            for chunk, result in zip(chunks, results, strict=True)
+            if isinstance(result, Exception)
+            for secret in chunk
+        ]
+        added = len(new_secrets) - len(failed)
+        if not failed:
             console.print(
-                f"[yellow]Secrets setup returned status code {response.status_code}.[/yellow]"  # noqa: E501
+                f"[green]Secrets setup successful![/green] Added {added} new "
+                f"secrets, {len(secrets) - added} already existed."
             )
             console.print(
-                "Please go to your GitHub repository settings to manually set up the following secrets:"  # noqa: E501
+                f"Please go to {CasedConstants.API_BASE_URL}/secrets/{project_name} to update these secrets."  # noqa: E501
             )
-            for secret in secrets:
-                console.print(f"- {secret}")
+            return True
+
+        error = next(result for result in results if isinstance(result, Exception))
+        console.print(
+            f"[yellow]Could not set up {len(failed)} of {len(new_secrets)} new secrets: {(str(error).splitlines() or [repr(error)])[0]}[/yellow]"  # noqa: E501
+        )
+        console.print(
+            "Please go to your GitHub repository settings to manually set up the following secrets:"  # noqa: E501
+        )
+        console.print(", ".join(failed))
+        return False
+
+
+class AsyncCasedAPI:
+    """
+    asyncio front-end for CasedAPI, used to fan out many read-only calls (e.g.
+    targets or deployments for every project) concurrently instead of making N
+    sequential round trips.
+
+    Calls run on worker threads over the shared pooled session, so they reuse
+    keep-alive connections and the same retry/timeout policy as CasedAPI. At
+    most `max_concurrency` requests are in flight at once.
+    """
+
+    def __init__(self, api=None, max_concurrency=CasedConstants.API_MAX_CONCURRENCY):
+        self.api = api or CasedAPI()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _call(self, func, *args, **kwargs):
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get_projects(self):
+        return await self._call(self.api.get_projects)
+
+    async def get_branches(self, project_name):
+        return await self._call(self.api.get_branches, project_name)
+
+    async def get_targets(self, project_name):
+        return await self._call(self.api.get_targets, project_name)
+
+    async def get_deployments(self, project_name, target_name=None):
+        return await self._call(self.api.get_deployments, project_name, target_name)
+
+    async def map_projects(self, method_name, project_names, **kwargs):
+        """
+        Call `method_name` (e.g. "get_targets") for every project concurrently.
+
+        Returns a dict of project name -> response, or the raised exception for
+        projects whose request failed, so one bad project does not sink the rest.
+        """
+        method = getattr(self, method_name)
+        project_names = list(project_names)
+        results = await asyncio.gather(
+            *(method(project_name, **kwargs) for project_name in project_names),
+            return_exceptions=True,
+        )
+        return dict(zip(project_names, results, strict=True))
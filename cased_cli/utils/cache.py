@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+from cased_cli.utils.constants import CasedConstants
+
+# Process-wide cache mode, set from the global --no-cache/--refresh options.
+_cache_mode = {
+    "enabled": os.environ.get("CASED_NO_CACHE", "") in ("", "0"),
+    "refresh": False,
+}
+_response_cache = None
+
+
+def configure_cache(enabled: bool = True, refresh: bool = False) -> None:
+    """
+    Set how API responses are cached for the rest of the process.
+
+    enabled=False bypasses the cache entirely (no reads, no writes).
+    refresh=True ignores TTLs and always revalidates cached entries with the
+    server, which is cheap when the server answers 304 Not Modified.
+    """
+    _cache_mode["enabled"] = enabled
+    _cache_mode["refresh"] = refresh
+
+
+def cache_enabled() -> bool:
+    return _cache_mode["enabled"]
+
+
+def cache_refresh() -> bool:
+    return _cache_mode["refresh"]
+
+
+def get_response_cache() -> "ResponseCache":
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+class ResponseCache:
+    """
+    On-disk cache of read-only API responses.
+
+    Each entry is a JSON file named `<resource>-<key>.json` holding the decoded
+    response body and the validators (ETag/Last-Modified) needed to revalidate
+    it. The directory is bounded to `max_bytes`, evicting least recently used
+    entries first; file mtimes track recency.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = CasedConstants.HTTP_CACHE_DIR,
+        max_bytes: int = CasedConstants.HTTP_CACHE_MAX_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(method: str, url: str, params: Optional[Dict], auth: str) -> str:
+        params = sorted(
+            (str(key), str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+        raw = json.dumps([method.upper(), url, params, auth])
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def _path(self, resource_name: str, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{resource_name}-{key}.json")
+
+    def get(self, resource_name: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(resource_name, key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            # Mark as recently used for LRU eviction.
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def set(
+        self,
+        resource_name: str,
+        key: str,
+        body: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        entry = {
+            "stored_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(resource_name, key))
+            self._evict()
+        except OSError:
+            # The cache is an optimization; never fail a command because of it.
+            pass
+
+    def refresh(self, resource_name: str, key: str, entry: Dict[str, Any]) -> None:
+        """Restart the TTL of an entry the server confirmed is still valid."""
+        self.set(
+            resource_name, key, entry["body"], entry["etag"], entry["last_modified"]
+        )
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any], ttl: float) -> bool:
+        return time.time() - entry.get("stored_at", 0) < ttl
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def invalidate(self, resource_name: Optional[str] = None) -> None:
+        """Drop all entries of `resource_name`, or every entry if not given."""
+        prefix = f"{resource_name}-" if resource_name else ""
+        for entry in self._entries():
+            if entry.name.startswith(prefix):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _entries(self):
+        try:
+            with os.scandir(self.cache_dir) as it:
+                return [e for e in it if e.is_file() and e.name.endswith(".json")]
+        except OSError:
+            return []
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -1,33 +1,104 @@
 import os
+import tempfile
 
 from cased_cli.utils.constants import CasedConstants
+from cased_cli.utils.tracing import span
+from filelock import FileLock
+
+
+class ConfigStore:
+    """
+    Process-wide access to key=value config files.
+
+    Each file is parsed once and memoized until its mtime, size or inode
+    changes, so the several load_config calls a single command makes cost one
+    stat each. Writes happen under a file lock and go through a temp file plus
+    os.replace, so concurrent CLI processes sharing a home directory never see
+    a partially written file.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    @staticmethod
+    def _signature(stat):
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    @staticmethod
+    def _parse(file_path):
+        config = {}
+        with open(file_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                key, value = line.split("=", 1)
+                config[key] = value
+        return config
+
+    def _read(self, file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            self._cache.pop(file_path, None)
+            return None
+
+        signature = self._signature(stat)
+        cached = self._cache.get(file_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        config = self._parse(file_path)
+        self._cache[file_path] = (signature, config)
+        return config
+
+    def load(self, file_path):
+        config = self._read(file_path)
+        # Callers may mutate the result; never hand out the memoized dict.
+        return dict(config) if config is not None else None
+
+    def save(self, data, config_dir, file_path):
+        os.makedirs(config_dir, mode=0o700, exist_ok=True)
+        with FileLock(f"{file_path}.lock"):
+            # Re-read under the lock so updates from other processes are kept.
+            self._cache.pop(file_path, None)
+            config = dict(self._read(file_path) or {})
+            config.update(data)
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(file_path) or ".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    for key, value in config.items():
+                        f.write(f"{key}={value}\n")
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._cache[file_path] = (self._signature(os.stat(file_path)), config)
+
+    def delete(self, file_path):
+        with FileLock(f"{file_path}.lock"):
+            self._cache.pop(file_path, None)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+_store = ConfigStore()
 
 
 def load_config(file_path=CasedConstants.ENV_FILE):
-    if not os.path.exists(file_path):
-        return None
-    config = {}
-    with open(file_path, "r") as f:
-        for line in f:
-            key, value = line.strip().split("=", 1)
-            config[key] = value
-    return config
+    with span("config load"):
+        return _store.load(file_path)
 
 
 def save_config(
     data, config_dir=CasedConstants.CONFIG_DIR, file_name=CasedConstants.ENV_FILE
 ):
-    os.makedirs(config_dir, mode=0o700, exist_ok=True)
-    current_config = load_config(file_name)
-
-    if not current_config:
-        current_config = {}
-    current_config.update(data)
-    with open(file_name, "w") as f:
-        for key, value in current_config.items():
-            f.write(f"{key}={value}\n")
+    _store.save(data, config_dir, file_name)
 
 
 def delete_config(file_name=CasedConstants.ENV_FILE):
     if os.path.exists(file_name):
-        os.remove(file_name)
+        _store.delete(file_name)
@@ -8,6 +8,7 @@ class CasedConstants:
     ### Config files
     CONFIG_DIR = os.path.expanduser("~/.cased/config")
     ENV_FILE = os.path.join(CONFIG_DIR, "env")
+    CACHE_DIR = os.path.expanduser("~/.cased/cache")
 
     ### API Constants
     CASED_API_AUTH_KEY = "CASED_API_AUTH_KEY"
@@ -17,6 +18,42 @@ class CasedConstants:
     BASE_URL = os.environ.get("CASED_BASE_URL", default="https://app.cased.com")
     API_BASE_URL = BASE_URL + "/api/v1"
 
+    # HTTP client settings
+    HTTP_CONNECT_TIMEOUT = float(os.environ.get("CASED_CONNECT_TIMEOUT", default=5))
+    HTTP_READ_TIMEOUT = float(os.environ.get("CASED_READ_TIMEOUT", default=30))
+    HTTP_POOL_CONNECTIONS = 4
+    HTTP_POOL_MAXSIZE = 16
+    HTTP_MAX_RETRIES = 3
+    HTTP_BACKOFF_FACTOR = 0.5
+    HTTP_MAX_BACKOFF = 10
+    HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    # Must not exceed HTTP_POOL_MAXSIZE, or concurrent calls will queue on the pool.
+    API_MAX_CONCURRENCY = 8
+    API_PAGE_SIZE = 50
+    # Secret names sent per request when setting up secrets.
+    SECRETS_BATCH_SIZE = 50
+
+    # Response cache for read-only endpoints, keyed by resource name.
+    # Resources without a TTL here are never cached.
+    HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+    HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024
+    HTTP_CACHE_TTLS = {
+        "projects": 300,
+        "targets": 300,
+        "branches": 30,
+        "deployments": 10,
+    }
+
+    # Deployment statuses, compared case-insensitively
+    DEPLOYMENT_SUCCESS_STATUSES = ("success", "succeeded", "completed", "deployed")
+    DEPLOYMENT_FAILURE_STATUSES = (
+        "failure",
+        "failed",
+        "error",
+        "cancelled",
+        "canceled",
+    )
+
     # Project related constants
     CASED_WORKING_PROJECT_NAME = "CASED_WORKING_PROJECT_NAME"
     CASED_WORKING_PROJECT_ID = "CASED_WORKING_PROJECT_ID"
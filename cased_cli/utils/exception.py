@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class CasedAPIError(Exception):
@@ -28,3 +28,21 @@ class CasedAPIError(Exception):
         if self.response_body:
             error_msg += f"\nResponse body: {self.response_body}"
         return error_msg
+
+
+class CasedConfigError(ValueError):
+    def __init__(self, errors: List[str]):
+        """
+        Initialize the CasedConfigError.
+
+        Args:
+            errors (List[str]): Every validation error found in the configuration.
+        """
+        self.errors = errors
+        super().__init__("\n".join(errors))
+
+    def __str__(self):
+        """Return all errors, one per line."""
+        if len(self.errors) == 1:
+            return self.errors[0]
+        return "".join(f"\n  - {error}" for error in self.errors)
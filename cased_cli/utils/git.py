@@ -1,4 +1,5 @@
 import subprocess
+from typing import List, Optional
 
 from rich.console import Console
 
@@ -20,3 +21,49 @@ def get_repo_name() -> str:
             "[bold yellow]Warning: Unable to get repository name from git. Using 'unknown' as project name.[/bold yellow]"  # noqa: E501
         )
         return "unknown"
+
+
+def get_head_commit(cwd=None) -> Optional[str]:
+    """
+    Return the commit HEAD points to, or None if there is none (e.g. not a git
+    repo, or no commits yet).
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def get_changed_files(cwd=None, since: str = "HEAD") -> Optional[List[str]]:
+    """
+    Return paths (relative to `cwd`) of files that differ from commit `since`,
+    including untracked ones, or None if they cannot be determined (e.g. not a
+    git repo, or `since` is no longer known).
+    """
+    try:
+        diff = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", since, "--"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [
+        line for line in (diff.stdout + untracked.stdout).splitlines() if line.strip()
+    ]
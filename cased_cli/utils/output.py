@@ -0,0 +1,51 @@
+"""
+Output format selection for list-style commands.
+
+`cased --output json|ndjson|table` is stored here by the CLI group and read by
+the commands. In the machine-readable modes commands hand their rows to
+`emit_rows` instead of building rich tables: `json` prints one array and
+`ndjson` writes each row as soon as it arrives, so a paginated listing is
+never held in memory as a whole.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Optional
+
+import click
+from cased_cli.utils.tracing import span
+
+OUTPUT_FORMATS = ("table", "json", "ndjson")
+
+_output_format = "table"
+
+
+def configure_output(output_format: str) -> None:
+    global _output_format
+    _output_format = output_format
+
+
+def output_format() -> str:
+    return _output_format
+
+
+def machine_output() -> bool:
+    """Whether rows should be printed as JSON instead of rendered as a table."""
+    return _output_format != "table"
+
+
+def emit_rows(
+    rows: Iterable[Dict[str, Any]], output_format: Optional[str] = None
+) -> int:
+    """Print rows in the JSON output format and return how many were printed."""
+    output_format = output_format or _output_format
+    with span("render", output=output_format):
+        if output_format == "ndjson":
+            count = 0
+            for row in rows:
+                click.echo(json.dumps(row, default=str))
+                count += 1
+            return count
+
+        rows = list(rows)
+        click.echo(json.dumps(rows, indent=2, default=str))
+        return len(rows)
@@ -1,11 +1,174 @@
+import contextvars
+import os
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
-from typing import Any, Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional, Tuple
 
+import click
+from cased_cli.utils.constants import CasedConstants
 from cased_cli.utils.exception import CasedAPIError
+from cased_cli.utils.output import machine_output
 from rich.console import Console
-from rich.progress import Progress
+
+_executor = None
+_executor_lock = threading.Lock()
+# Cancellation event of the run a task belongs to, visible inside the task.
+_cancel_event = contextvars.ContextVar("cased_cancel_event", default=None)
+# time.monotonic() deadline of the run a task belongs to, if it has a timeout.
+_deadline = contextvars.ContextVar("cased_deadline", default=None)
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a task whose run timed out, failed or was interrupted."""
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """The long-lived worker pool shared by every progress run in the process."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=CasedConstants.API_MAX_CONCURRENCY,
+                thread_name_prefix="cased-worker",
+            )
+    return _executor
+
+
+def check_cancelled() -> None:
+    """
+    Raise TaskCancelledError if the run of the calling task was cancelled.
+
+    Long-running tasks (e.g. paginated API reads) call this between steps so
+    a timeout stops them instead of leaving them running in the background.
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise TaskCancelledError("Task was cancelled")
+
+
+def time_left() -> Optional[float]:
+    """
+    Seconds left before the run of the calling task times out, or None when
+    it has no timeout. Requests use it to cap their own timeouts.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def _submit(
+    func: Callable[[], Any],
+    cancel_event: threading.Event,
+    deadline: Optional[float] = None,
+):
+    context = contextvars.copy_context()
+    context.run(_cancel_event.set, cancel_event)
+    context.run(_deadline.set, deadline)
+    return get_executor().submit(context.run, func)
+
+
+def exit_without_waiting(code: int) -> None:
+    """
+    Exit right away, even if worker threads are still blocked on a request.
+
+    A normal exit joins the executor's threads, so a timed out request would
+    keep the process alive until it finishes. Close callbacks of the command
+    (e.g. writing a trace) still run and output is flushed first.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None:
+        ctx.find_root().close()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def run_tasks(
+    tasks: Iterable[Tuple[str, Callable[[], Any]]],
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run (description, func) tasks on the shared executor, tracked in a single
+    Progress display, and return their results in order.
+
+    The caller is woken by concurrent.futures.wait as soon as a task finishes.
+    On timeout, on the first task error (unless return_exceptions is set, in
+    which case the exception is returned as that task's result) or on Ctrl-C,
+    queued tasks are cancelled, running ones are signalled through
+    check_cancelled(), and the error is raised.
+    """
+    tasks = list(tasks)
+    results = [None] * len(tasks)
+    cancel_event = threading.Event()
+    limit = max_concurrency or len(tasks)
+    deadline = time.monotonic() + timeout if timeout else None
+
+    progress = None
+    if not machine_output():
+        from rich.progress import Progress
+
+        progress = Progress()
+        # Indeterminate (pulsing) bars until each task finishes.
+        task_ids = [
+            progress.add_task(f"[green]{description}", total=None)
+            for description, _ in tasks
+        ]
+        progress.start()
+
+    pending = {}
+    queued = iter(enumerate(tasks))
+
+    def submit_next():
+        for index, (_, func) in queued:
+            pending[_submit(func, cancel_event, deadline)] = index
+            return
+
+    try:
+        for _ in range(limit):
+            submit_next()
+
+        while pending:
+            remaining = deadline - time.monotonic() if deadline else None
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"Timed out after {timeout} seconds")
+
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                description = tasks[index][0]
+                try:
+                    results[index] = future.result()
+                    status = (
+                        "[bold green]Done!"
+                        if len(tasks) == 1
+                        else f"[green]✓ {description}"
+                    )
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+                    status = f"[red]✗ {description}"
+                if progress:
+                    progress.update(
+                        task_ids[index], total=1, completed=1, description=status
+                    )
+                submit_next()
+    except BaseException:
+        cancel_event.set()
+        for future in pending:
+            future.cancel()
+        raise
+    finally:
+        if progress:
+            progress.stop()
+
+    return results
 
 
 def run_process_with_status_bar(
@@ -15,37 +178,23 @@ def run_process_with_status_bar(
     *args,
     **kwargs,
 ) -> Any:
-    console = Console()
-    result = None
-    progress = Progress()
-    task = progress.add_task(f"[green]{description}", total=100)
-
-    progress.start()
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        future = executor.submit(process_func, *args, **kwargs)
-        start_time = time.time()
-        while not future.done() and time.time() - start_time < timeout:
-            elapsed = int(time.time() - start_time)
-            steps = (elapsed / timeout) * 100
-            progress.update(task, completed=min(steps, 100))
-            time.sleep(0.1)
-
-        try:
-            result = future.result(timeout=0)  # Non-blocking check
-            progress.update(task, completed=100, description="[bold green]Done!")
-        except TimeoutError:
-            console.print(
-                f"\n[bold red]Process timed out after {timeout} seconds. Please try again later."
-            )
-            sys.exit(1)
-        except CasedAPIError as e:
-            console.print(f"\n[bold red]API Error: {e}")
-            sys.exit(1)
-        except Exception as _:
-            console.print(
-                "\n[bold red]An unexpected error occurred, please try again later."
-            )
-            sys.exit(1)
-
-    progress.stop()
-    return result
+    # JSON output gets no progress bar (nor its imports) and errors go to
+    # stderr, so stdout only carries the JSON.
+    console = Console(stderr=machine_output())
+    try:
+        return run_tasks(
+            [(description, partial(process_func, *args, **kwargs))], timeout=timeout
+        )[0]
+    except TimeoutError:
+        console.print(
+            f"\n[bold red]Process timed out after {timeout} seconds. Please try again later."
+        )
+        exit_without_waiting(1)
+    except CasedAPIError as e:
+        console.print(f"\n[bold red]API Error: {e}")
+        sys.exit(1)
+    except Exception as _:
+        console.print(
+            "\n[bold red]An unexpected error occurred, please try again later."
+        )
+        sys.exit(1)
@@ -0,0 +1,272 @@
+"""
+Loading and validation of the project configuration in .cased/config.yaml.
+
+The schema is declared once below and compiled into a flat list of rules at
+import time, so validating a config is a single pass that reports every
+problem instead of stopping at the first one.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    # libyaml-backed loader, an order of magnitude faster than the pure-Python one.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader
+
+CONFIG_PATH = ".cased/config.yaml"
+# Directories never searched for service configs.
+EXCLUDE_DIRS = {"node_modules", "venv", "dist", "__pycache__"}
+
+
+def load_project_config(file_path: str = CONFIG_PATH) -> Dict[str, Any]:
+    with open(file_path, "rb") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def discover_configs(root: str = ".") -> List[str]:
+    """Find every .cased/config.yaml below `root`, skipping hidden/vendored dirs."""
+    config_paths = []
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d not in EXCLUDE_DIRS
+        )
+        config_path = os.path.join(dirpath, CONFIG_PATH)
+        if os.path.isfile(config_path):
+            config_paths.append(os.path.normpath(config_path))
+    return config_paths
+
+
+class Field:
+    """
+    Schema for one config key.
+
+    Args:
+        required (bool): Whether the key must be present.
+        type (type | tuple): Allowed value type(s), checked when present.
+        choices (tuple): Allowed values, checked when present.
+        fields (dict): Schemas of nested keys, for mapping values.
+        when (callable): Predicate on the whole config; the field (and its
+            nested fields) is only checked when it returns True.
+        missing (str): Custom message used when a required key is missing.
+    """
+
+    def __init__(
+        self,
+        required: bool = False,
+        type: Optional[Any] = None,
+        choices: Optional[Tuple] = None,
+        fields: Optional[Dict[str, "Field"]] = None,
+        when: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        missing: Optional[str] = None,
+    ):
+        self.required = required
+        self.type = dict if fields and type is None else type
+        self.choices = choices
+        self.fields = fields or {}
+        self.when = when
+        self.missing = missing
+
+
+def _docker_enabled(config: Dict[str, Any]) -> bool:
+    docker = config.get("docker")
+    return isinstance(docker, dict) and bool(docker.get("enabled"))
+
+
+def _python_project(config: Dict[str, Any]) -> bool:
+    environment = config.get("environment")
+    if not isinstance(environment, dict):
+        return True
+    return str(environment.get("language", "python")).lower() != "javascript"
+
+
+def _rollout_expected(config: Dict[str, Any]) -> bool:
+    """
+    A rollout section is present, or needed because autoscaling deploys to
+    several instances (the templates then roll out over EC2_HOSTS).
+    """
+    cloud_deployment = config.get("cloud_deployment")
+    if not isinstance(cloud_deployment, dict):
+        return False
+    if "rollout" in cloud_deployment:
+        return True
+    autoscaling = cloud_deployment.get("autoscaling")
+    if not isinstance(autoscaling, dict) or not autoscaling.get("enabled"):
+        return False
+    max_instances = autoscaling.get("max_instances")
+    return isinstance(max_instances, int) and max_instances > 1
+
+
+def _docker_disabled(config: Dict[str, Any]) -> bool:
+    docker = config.get("docker")
+    return isinstance(docker, dict) and "enabled" in docker and not docker["enabled"]
+
+
+CONFIG_SCHEMA = {
+    "project": Field(required=True, fields={"name": Field(required=True)}),
+    "environment": Field(
+        required=True,
+        fields={
+            "language": Field(required=True),
+            "python_version": Field(required=True, when=_python_project),
+            "dependency_files": Field(type=list),
+        },
+    ),
+    "docker": Field(
+        required=True,
+        fields={
+            "enabled": Field(
+                required=True, missing="Missing 'enabled' field in 'docker' section"
+            ),
+            "ECR Repository Name": Field(required=True, when=_docker_enabled),
+            "dockerfile_path": Field(required=True, when=_docker_enabled),
+            "image_name": Field(required=True, when=_docker_enabled),
+            "ports": Field(type=list, when=_docker_enabled),
+            "environment": Field(type=list, when=_docker_enabled),
+            "cache": Field(
+                when=_docker_enabled,
+                fields={
+                    "enabled": Field(type=bool),
+                    "backend": Field(choices=("registry", "gha")),
+                    "mode": Field(choices=("min", "max")),
+                },
+            ),
+        },
+    ),
+    "cloud_deployment": Field(
+        fields={
+            "autoscaling": Field(fields={"enabled": Field(type=bool)}),
+            "rollout": Field(
+                required=True,
+                when=_rollout_expected,
+                missing=(
+                    "Missing 'rollout' section in 'cloud_deployment' section, "
+                    "needed to deploy to more than one autoscaled instance"
+                ),
+                fields={
+                    "batch_size": Field(type=int),
+                    "max_unavailable": Field(type=int),
+                    "health_check": Field(
+                        required=True,
+                        missing=(
+                            "Missing 'health_check' in 'cloud_deployment.rollout' "
+                            "section, which gates each rollout batch"
+                        ),
+                        fields={
+                            "command": Field(type=str),
+                            "path": Field(type=str),
+                            "port": Field(type=int),
+                            "retries": Field(type=int),
+                            "interval": Field(type=int),
+                        },
+                    ),
+                },
+            ),
+        },
+    ),
+    "runtime": Field(
+        required=True,
+        when=_docker_disabled,
+        missing="Missing 'runtime' section in config for non-docker setup",
+        fields={
+            "commands": Field(
+                required=True,
+                fields={
+                    "start": Field(required=True),
+                    "stop": Field(required=True),
+                    "restart": Field(required=True),
+                },
+            ),
+            "entry_point": Field(required=True),
+            "sync": Field(
+                fields={
+                    "method": Field(choices=("rsync", "artifact")),
+                    "compress": Field(type=bool),
+                    "exclude": Field(type=list),
+                    "artifact": Field(type=str),
+                },
+            ),
+        },
+    ),
+}
+
+_TYPE_NAMES = {
+    dict: "mapping",
+    list: "list",
+    str: "string",
+    bool: "boolean",
+    int: "whole number",
+}
+
+
+def _type_name(expected) -> str:
+    if isinstance(expected, tuple):
+        return " or ".join(_type_name(t) for t in expected)
+    return _TYPE_NAMES.get(expected, expected.__name__)
+
+
+def compile_schema(schema: Dict[str, Field]) -> Tuple[Tuple[Tuple[str, ...], Field]]:
+    """
+    Flatten a nested schema into (path, field) rules, parents before children,
+    so validation is a single loop over the rules.
+    """
+    rules = []
+
+    def _walk(fields, prefix):
+        for key, field in fields.items():
+            path = prefix + (key,)
+            rules.append((path, field))
+            _walk(field.fields, path)
+
+    _walk(schema, ())
+    return tuple(rules)
+
+
+_COMPILED_SCHEMA = compile_schema(CONFIG_SCHEMA)
+
+
+def _location(path: Tuple[str, ...]) -> str:
+    if len(path) == 1:
+        return f"'{path[0]}' section in config"
+    return f"'{path[-1]}' in '{'.'.join(path[:-1])}' section"
+
+
+def validate_project_config(config: Any) -> List[str]:
+    """Validate a loaded config and return every error found (empty if valid)."""
+    if not isinstance(config, dict):
+        return ["Configuration must be a mapping of sections"]
+
+    errors = []
+    # Paths whose values are missing or invalid; their nested rules are skipped.
+    skipped = set()
+    for path, field in _COMPILED_SCHEMA:
+        if path[:-1] in skipped:
+            skipped.add(path)
+            continue
+        if field.when is not None and not field.when(config):
+            skipped.add(path)
+            continue
+
+        parent = config
+        for key in path[:-1]:
+            parent = parent[key]
+
+        key = path[-1]
+        if key not in parent:
+            skipped.add(path)
+            if field.required:
+                errors.append(field.missing or f"Missing {_location(path)}")
+            continue
+
+        value = parent[key]
+        if field.type is not None and not isinstance(value, field.type):
+            skipped.add(path)
+            errors.append(f"{_location(path)} must be a {_type_name(field.type)}")
+        elif field.choices is not None and value not in field.choices:
+            choices = ", ".join(repr(choice) for choice in field.choices)
+            errors.append(f"{_location(path)} must be one of {choices}")
+
+    return errors
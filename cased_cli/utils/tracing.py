@@ -0,0 +1,254 @@
+"""
+Opt-in timing instrumentation, enabled with `cased --trace` / CASED_TRACE=1
+and/or `cased --trace-file PATH`.
+
+While tracing, every API request is recorded with its connect (DNS + TCP),
+TLS, time-to-first-byte and transfer times, response size, status and retry
+count, next to spans for the phases of the command itself (config load, API
+calls, rendering). At exit a summary is printed to stderr and/or a Chrome
+trace-event JSON file is written, which chrome://tracing or Perfetto can open.
+
+Connect and TLS times come from wrapping urllib3's connection setup, which is
+only done once tracing is switched on; with tracing off `span` and
+`traced_request` cost a single global lookup.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+_tracer = None
+# Connection setup times of the current thread's in-flight request.
+_connection_timings = threading.local()
+
+
+def _install_connection_timing() -> None:
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+
+    if getattr(HTTPConnection, "_cased_traced", False):
+        return
+
+    new_conn = HTTPConnection._new_conn
+    https_connect = HTTPSConnection.connect
+
+    def _timed_new_conn(self):
+        start = time.perf_counter()
+        try:
+            return new_conn(self)
+        finally:
+            _connection_timings.connect = getattr(
+                _connection_timings, "connect", 0.0
+            ) + (time.perf_counter() - start)
+
+    def _timed_https_connect(self):
+        connect_before = getattr(_connection_timings, "connect", 0.0)
+        start = time.perf_counter()
+        try:
+            return https_connect(self)
+        finally:
+            # Everything but the TCP connect itself is the TLS handshake.
+            connect = getattr(_connection_timings, "connect", 0.0) - connect_before
+            _connection_timings.tls = getattr(_connection_timings, "tls", 0.0) + (
+                time.perf_counter() - start - connect
+            )
+
+    HTTPConnection._new_conn = _timed_new_conn
+    HTTPSConnection.connect = _timed_https_connect
+    HTTPConnection._cased_traced = True
+
+
+class Tracer:
+    """Collects spans and request timings as Chrome trace events."""
+
+    def __init__(
+        self,
+        command: Optional[str] = None,
+        trace_file: Optional[str] = None,
+        summary: bool = True,
+    ):
+        self.command = command or "cased"
+        self.trace_file = trace_file
+        self.summary = summary
+        self.origin = time.perf_counter()
+        self.events: List[Dict[str, Any]] = []
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _microseconds(self, perf_time: float) -> float:
+        return round((perf_time - self.origin) * 1_000_000, 1)
+
+    def add_span(
+        self, name: str, category: str, start: float, end: float, args=None
+    ) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._microseconds(start),
+            "dur": round((end - start) * 1_000_000, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args or {},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def trace_request(self, send: Callable, method: str, url: str, **kwargs):
+        _connection_timings.connect = 0.0
+        _connection_timings.tls = 0.0
+        start = time.perf_counter()
+        response = None
+        try:
+            response = send(method, url, **kwargs)
+            return response
+        finally:
+            end = time.perf_counter()
+            self._record_request(method, url, start, end, response)
+
+    def _record_request(self, method, url, start, end, response) -> None:
+        connect = _connection_timings.connect
+        tls = _connection_timings.tls
+        total = end - start
+        if response is not None:
+            # requests sets `elapsed` once the response headers arrived and
+            # only reads the body afterwards.
+            headers_received = response.elapsed.total_seconds()
+            transfer = max(0.0, total - headers_received)
+            ttfb = max(0.0, headers_received - connect - tls)
+            retries = getattr(getattr(response.raw, "retries", None), "history", ())
+            status = response.status_code
+            size = len(response.content)
+        else:
+            transfer = ttfb = 0.0
+            retries = ()
+            status = None
+            size = 0
+
+        path = urlsplit(url).path
+        request = {
+            "method": method,
+            "path": path,
+            "status": status,
+            "retries": len(retries),
+            "size": size,
+            "connect_ms": connect * 1000,
+            "tls_ms": tls * 1000,
+            "ttfb_ms": ttfb * 1000,
+            "transfer_ms": transfer * 1000,
+            "total_ms": total * 1000,
+        }
+        with self._lock:
+            self.requests.append(request)
+
+        name = f"{method} {path}"
+        self.add_span(name, "http", start, end, request)
+        # Lay the phases out one after another under the request span.
+        phase_start = start
+        for phase, duration in (
+            ("connect", connect),
+            ("tls", tls),
+            ("ttfb", ttfb),
+            ("transfer", transfer),
+        ):
+            if duration:
+                self.add_span(phase, "http", phase_start, phase_start + duration)
+                phase_start += duration
+
+    def finish(self) -> None:
+        self.add_span(f"cased {self.command}", "cli", self.origin, time.perf_counter())
+        if self.trace_file:
+            self.write_chrome_trace(self.trace_file)
+        if self.summary:
+            print_summary(self)
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, file)
+
+
+def print_summary(tracer: Tracer) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console(stderr=True)
+    if tracer.requests:
+        table = Table(title="HTTP requests (times in ms)")
+        table.add_column("Request", style="cyan")
+        table.add_column("Status")
+        table.add_column("Retries", justify="right")
+        table.add_column("Size", justify="right")
+        for column in ("Connect", "TLS", "TTFB", "Xfer", "Total"):
+            table.add_column(column, justify="right")
+        for request in tracer.requests:
+            table.add_row(
+                f"{request['method']} {request['path']}",
+                str(request["status"] or "error"),
+                str(request["retries"]),
+                f"{request['size']:,} B",
+                *(
+                    f"{request[key]:.1f}"
+                    for key in (
+                        "connect_ms",
+                        "tls_ms",
+                        "ttfb_ms",
+                        "transfer_ms",
+                        "total_ms",
+                    )
+                ),
+            )
+        console.print(table)
+
+    totals: Dict[str, List[float]] = {}
+    for event in tracer.events:
+        if event["cat"] != "http":
+            totals.setdefault(event["name"], []).append(event["dur"] / 1000)
+    table = Table(title="Spans")
+    table.add_column("Span", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Total", justify="right")
+    for name, durations in sorted(totals.items(), key=lambda item: -sum(item[1])):
+        table.add_row(name, str(len(durations)), f"{sum(durations):.1f} ms")
+    console.print(table)
+    if tracer.trace_file:
+        console.print(f"Chrome trace written to {tracer.trace_file}")
+
+
+def start_tracing(
+    command: Optional[str] = None,
+    trace_file: Optional[str] = None,
+    summary: bool = True,
+) -> Tracer:
+    global _tracer
+    _install_connection_timing()
+    _tracer = Tracer(command, trace_file, summary)
+    return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+@contextmanager
+def span(name: str, category: str = "cli", **args):
+    """Time the enclosed block as a span of the current trace, if any."""
+    tracer = _tracer
+    if tracer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.add_span(name, category, start, time.perf_counter(), args)
+
+
+def traced_request(send: Callable, method: str, url: str, **kwargs):
+    """Call `send(method, url, **kwargs)`, recording its timings when tracing."""
+    tracer = _tracer
+    if tracer is None:
+        return send(method, url, **kwargs)
+    return tracer.trace_request(send, method, url, **kwargs)